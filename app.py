@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import atexit
 import os
+import shutil
 import sys
 import tempfile
 import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import BinaryIO, Optional
 
 import streamlit as st
 
@@ -14,11 +20,22 @@ import streamlit as st
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from presentation_agent.agent import PresentationAgent, PresentationAgentError
-from presentation_agent.config import Config
+from presentation_agent.config import (
+    SPEED_PROFILE_BALANCED,
+    SPEED_PROFILE_FAST,
+    Config,
+)
+from presentation_agent.models import SpeakerProfile
 
 # Session state keys
 KEY_PROGRESS = "progress"
 KEY_RESULT_FILES = "result_files"
+KEY_FUTURE = "future"
+KEY_PROGRESS_LOCK = "progress_lock"
+KEY_OUTPUT_DIR = "output_dir"
+
+# Minimum interval between progress writes for the same step (seconds)
+PROGRESS_MIN_INTERVAL = 0.1
 
 THEMES = [
     "LIGHT_PROFESSIONAL",
@@ -41,6 +58,21 @@ LANGUAGES = [
     "Chinesisch (vereinfacht)",
 ]
 
+SPEED_PROFILE_OPTIONS = {
+    "Ausgewogen (beste Qualität)": SPEED_PROFILE_BALANCED,
+    "Schnell (kleinere Modelle)": SPEED_PROFILE_FAST,
+}
+
+# Injected on every run: Streamlit drops elements that a rerun does not emit.
+CUSTOM_CSS = """
+<style>
+.stTextInput input, .stNumberInput input { font-size: 1.05rem !important; }
+.stSelectbox > div { font-size: 1.05rem !important; }
+.stForm { max-width: 42rem; margin: 0 auto; }
+section.main .block-container { padding-top: 2rem; padding-bottom: 2rem; max-width: 44rem; }
+</style>
+"""
+
 AUDIENCE_PRESETS = [
     "Allgemeines Publikum",
     "Studierende",
@@ -60,26 +92,75 @@ def _ensure_progress_state() -> None:
             "status": "idle",  # idle | running | done | error
             "error": None,
         }
+    if KEY_PROGRESS_LOCK not in st.session_state:
+        st.session_state[KEY_PROGRESS_LOCK] = threading.Lock()
 
 
-@st.fragment(run_every=2)
-def _progress_ui() -> None:
-    """Poll and display progress; no full page reload."""
+def _progress_snapshot() -> dict:
+    """Consistent copy of the progress dict (worker thread writes under the lock)."""
     _ensure_progress_state()
-    progress = st.session_state[KEY_PROGRESS]
-    status = progress["status"]
+    with st.session_state[KEY_PROGRESS_LOCK]:
+        return dict(st.session_state[KEY_PROGRESS])
 
-    if status == "idle":
-        return
 
-    if status == "running":
-        st.markdown("---")
-        st.subheader("Präsentation wird erstellt …")
-        with st.status("Fortschritt", state="running", expanded=True):
-            st.caption(progress["step"] or "Starte …")
-            st.progress(min(100, max(0, progress["percent"])) / 100.0)
+def _current_future() -> Optional[Future]:
+    return st.session_state.get(KEY_FUTURE)
+
+
+def _is_running() -> bool:
+    """The worker future is the source of truth for whether a run is active."""
+    future = _current_future()
+    return future is not None and not future.done()
+
+
+def _open_result(path: Optional[str]) -> Optional[BinaryIO]:
+    """Open a generated file for download; None if missing (single syscall, no stat)."""
+    if not path:
+        return None
+    try:
+        return open(path, "rb")
+    except OSError:
+        return None
+
+
+def _session_output_dir() -> str:
+    """One temp dir per browser session, removed when the server process exits."""
+    if KEY_OUTPUT_DIR not in st.session_state:
+        tmpdir = tempfile.mkdtemp(prefix="presentation_agent_")
+        atexit.register(shutil.rmtree, tmpdir, ignore_errors=True)
+        st.session_state[KEY_OUTPUT_DIR] = tmpdir
+    return st.session_state[KEY_OUTPUT_DIR]
+
+
+@st.cache_resource(show_spinner=False)
+def _get_executor() -> ThreadPoolExecutor:
+    """Bounded worker pool shared by all sessions of this server process."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="pres-agent")
+
+
+@st.fragment(run_every=0.25)
+def _progress_ui_running() -> None:
+    """Poll and display progress while running; no full page reload."""
+    if not _is_running():
+        # Generation finished: rerun the whole app so the terminal view mounts
+        # and this polling fragment is no longer scheduled.
+        st.rerun()
         return
 
+    st.markdown("---")
+    st.subheader("Präsentation wird erstellt …")
+    progress = _progress_snapshot()
+    with st.status("Fortschritt", state="running", expanded=True):
+        st.caption(progress["step"] or "Starte …")
+        st.progress(min(100, max(0, progress["percent"])) / 100.0)
+
+
+@st.fragment
+def _progress_ui_terminal() -> None:
+    """Display done/error state once; does not poll."""
+    progress = _progress_snapshot()
+    status = progress["status"]
+
     if status == "error":
         st.markdown("---")
         st.error("Generierung fehlgeschlagen")
@@ -87,7 +168,7 @@ def _progress_ui() -> None:
         if "Konfiguration" in str(progress.get("error") or ""):
             st.info("Bitte OPENAI_API_KEY und UNSPLASH_ACCESS_KEY in der .env-Datei setzen.")
         if st.button("Erneut versuchen", key="retry_btn"):
-            for key in (KEY_PROGRESS, KEY_RESULT_FILES):
+            for key in (KEY_PROGRESS, KEY_RESULT_FILES, KEY_FUTURE):
                 st.session_state.pop(key, None)
             st.rerun()
         return
@@ -95,37 +176,65 @@ def _progress_ui() -> None:
     if status == "done":
         st.markdown("---")
         files = st.session_state.get(KEY_RESULT_FILES) or {}
-        ppt_bytes = files.get("ppt")
-        docx_bytes = files.get("docx")
+        ppt_path = files.get("ppt")
+        docx_path = files.get("docx")
         slide_count = files.get("slide_count", 0)
         images_included = files.get("images_included", 0)
 
-        if ppt_bytes:
-            st.success(
-                f"Fertig: {slide_count} Folien mit {images_included} Bildern."
-            )
-            st.download_button(
-                label="PowerPoint herunterladen (.pptx)",
-                data=ppt_bytes,
-                file_name="praesentation.pptx",
-                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                type="primary",
-                key="dl_pptx",
-            )
-        if docx_bytes:
-            st.download_button(
-                label="Manuskript herunterladen (.docx)",
-                data=docx_bytes,
-                file_name="manuskript.docx",
-                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                key="dl_docx",
-            )
+        # Only paths live in session_state; file contents are read from disk
+        # when the download button is rendered.
+        ppt_file = _open_result(ppt_path)
+        if ppt_file is not None:
+            with ppt_file:
+                st.success(
+                    f"Fertig: {slide_count} Folien mit {images_included} Bildern."
+                )
+                st.download_button(
+                    label="PowerPoint herunterladen (.pptx)",
+                    data=ppt_file,
+                    file_name="praesentation.pptx",
+                    mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                    type="primary",
+                    key="dl_pptx",
+                )
+        docx_file = _open_result(docx_path)
+        if docx_file is not None:
+            with docx_file:
+                st.download_button(
+                    label="Manuskript herunterladen (.docx)",
+                    data=docx_file,
+                    file_name="manuskript.docx",
+                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    key="dl_docx",
+                )
         if st.button("Neue Präsentation erstellen", type="secondary", key="new_pres_btn"):
-            for key in (KEY_PROGRESS, KEY_RESULT_FILES):
+            for key in (KEY_PROGRESS, KEY_RESULT_FILES, KEY_FUTURE):
                 st.session_state.pop(key, None)
             st.rerun()
 
 
+def _progress_ui() -> None:
+    """Mount only the fragment matching the current status (idle mounts nothing)."""
+    if _is_running():
+        _progress_ui_running()
+        return
+    status = _progress_snapshot()["status"]
+    if status in ("done", "error"):
+        _progress_ui_terminal()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_agent(speed_profile: str) -> PresentationAgent:
+    """
+    Build one agent per speed profile and share it across sessions.
+
+    The agent holds only stateless pieces (event loop, HTTP/LLM clients,
+    response caches, the re-entrant exporter); every run builds its own
+    pipeline stages, so concurrent sessions don't share per-run state.
+    """
+    return PresentationAgent(Config.from_env(speed_profile))
+
+
 def main() -> None:
     st.set_page_config(
         page_title="KI Präsentations-Generator",
@@ -134,23 +243,14 @@ def main() -> None:
         initial_sidebar_state="collapsed",
     )
 
-    st.markdown(
-        """
-        <style>
-        .stTextInput input, .stNumberInput input { font-size: 1.05rem !important; }
-        .stSelectbox > div { font-size: 1.05rem !important; }
-        .stForm { max-width: 42rem; margin: 0 auto; }
-        section.main .block-container { padding-top: 2rem; padding-bottom: 2rem; max-width: 44rem; }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
     st.title("📊 KI Präsentations-Generator")
     st.markdown("Erstelle eine Präsentation zu einem Thema. Wähle unten Design und Optionen.")
 
     _ensure_progress_state()
     progress = st.session_state[KEY_PROGRESS]
+    progress_lock = st.session_state[KEY_PROGRESS_LOCK]
 
     with st.form("presentation_form", clear_on_submit=False):
         st.subheader("Einstellungen")
@@ -212,6 +312,13 @@ def main() -> None:
             help="Visuelles Theme für die Folien.",
         )
 
+        speed_label = st.selectbox(
+            "Qualität vs. Geschwindigkeit",
+            options=list(SPEED_PROFILE_OPTIONS),
+            index=0,
+            help="Schnell nutzt kleinere Modelle für alle Schritte.",
+        )
+
         submitted = st.form_submit_button("Präsentation erstellen")
 
     if not submitted:
@@ -224,35 +331,65 @@ def main() -> None:
         return
 
     # Only start generation if not already running
-    if progress["status"] == "running":
+    if _is_running():
         _progress_ui()
         return
 
-    # Persistent output path (kept for the lifetime of the run)
-    tmpdir = tempfile.mkdtemp(prefix="presentation_agent_")
-    output_pptx = os.path.join(tmpdir, "presentation.pptx")
+    try:
+        agent = _get_agent(SPEED_PROFILE_OPTIONS[speed_label])
+    except ValueError as e:
+        with progress_lock:
+            progress["status"] = "error"
+            progress["error"] = f"Konfigurationsfehler: {e}"
+        _progress_ui()
+        return
 
-    speaker_profile = None
-    if speaker_age and speaker_age != 30:
-        speaker_profile = {"age": int(speaker_age)}
+    # Unique file per run so a new run never overwrites a pending download
+    output_pptx = os.path.join(
+        _session_output_dir(), f"presentation_{uuid.uuid4().hex}.pptx"
+    )
+
+    speaker_profile = (
+        SpeakerProfile(age=int(speaker_age))
+        if speaker_age and speaker_age != 30
+        else None
+    )
 
-    # Set progress to running and start background thread.
-    # Thread only mutates these dicts (no st.session_state access from thread).
-    progress["step"] = "Starte …"
-    progress["percent"] = 0
-    progress["status"] = "running"
-    progress["error"] = None
+    # Set progress to running and submit to the worker pool.
+    # Worker only mutates these dicts, under progress_lock
+    # (no st.session_state access from the worker thread).
     result_holder = st.session_state.setdefault(KEY_RESULT_FILES, {})
-    result_holder.clear()
+    with progress_lock:
+        progress["step"] = "Starte …"
+        progress["percent"] = 0
+        progress["status"] = "running"
+        progress["error"] = None
+        result_holder.clear()
+
+    def set_error(message: str) -> None:
+        with progress_lock:
+            progress["status"] = "error"
+            progress["error"] = message
 
     def run_agent() -> None:
         try:
-            config = Config.from_env()
-            agent = PresentationAgent(config)
+            last_emit = 0.0
 
             def on_progress(step_name: str, percent: int = 0) -> None:
-                progress["step"] = step_name
-                progress["percent"] = percent
+                # Coalesce bursts of updates within one step; a new step or
+                # completion is always written so the UI never shows a stale step.
+                nonlocal last_emit
+                now = time.monotonic()
+                if (
+                    step_name == progress["step"]
+                    and percent < 100
+                    and now - last_emit < PROGRESS_MIN_INTERVAL
+                ):
+                    return
+                last_emit = now
+                with progress_lock:
+                    progress["step"] = step_name
+                    progress["percent"] = percent
 
             result = agent.run(
                 topic=topic,
@@ -265,28 +402,22 @@ def main() -> None:
                 progress_callback=on_progress,
             )
             # Persist to shared dicts (same refs as in session_state)
-            ppt_path = Path(result.output_path)
-            result_holder["ppt"] = ppt_path.read_bytes() if ppt_path.exists() else None
-            result_holder["docx"] = None
-            if result.script_path and Path(result.script_path).exists():
-                result_holder["docx"] = Path(result.script_path).read_bytes()
-            result_holder["slide_count"] = result.slide_count
-            result_holder["images_included"] = result.images_included
-            progress["status"] = "done"
-            progress["percent"] = 100
-            progress["step"] = "Fertig"
+            with progress_lock:
+                result_holder["ppt"] = result.output_path
+                result_holder["docx"] = result.script_path
+                result_holder["slide_count"] = result.slide_count
+                result_holder["images_included"] = result.images_included
+                progress["status"] = "done"
+                progress["percent"] = 100
+                progress["step"] = "Fertig"
         except ValueError as e:
-            progress["status"] = "error"
-            progress["error"] = f"Konfigurationsfehler: {e}"
+            set_error(f"Konfigurationsfehler: {e}")
         except PresentationAgentError as e:
-            progress["status"] = "error"
-            progress["error"] = str(e)
+            set_error(str(e))
         except Exception as e:
-            progress["status"] = "error"
-            progress["error"] = f"Erstellung fehlgeschlagen: {e}"
+            set_error(f"Erstellung fehlgeschlagen: {e}")
 
-    thread = threading.Thread(target=run_agent, daemon=True)
-    thread.start()
+    st.session_state[KEY_FUTURE] = _get_executor().submit(run_agent)
 
     _progress_ui()
 
@@ -1,6 +1,7 @@
 """AI Presentation Agent - Generate presentations from minimal user input."""
 
-from presentation_agent.agent import PresentationAgent
+from typing import TYPE_CHECKING
+
 from presentation_agent.models import (
     ExportResult,
     PresentationManuscript,
@@ -11,6 +12,9 @@ from presentation_agent.models import (
     UserInput,
 )
 
+if TYPE_CHECKING:
+    from presentation_agent.agent import PresentationAgent
+
 __all__ = [
     "PresentationAgent",
     "UserInput",
@@ -21,3 +25,12 @@ __all__ = [
     "SlideWithImage",
     "ExportResult",
 ]
+
+
+def __getattr__(name: str):
+    """Import PresentationAgent (openai, httpx, pptx, docx) on first access."""
+    if name == "PresentationAgent":
+        from presentation_agent.agent import PresentationAgent
+
+        return PresentationAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional
 
-from presentation_agent.config import Config
+from presentation_agent.cache import open_disk_cache
+from presentation_agent.config import SPEED_PROFILE_FAST, Config
+from presentation_agent.http_client import create_async_client
 from presentation_agent.image_service import ImageService, ImageServiceError
-from presentation_agent.llm_client import LLMClient
-from presentation_agent.models import ExportResult, SpeakerProfile, SlideWithImage, UserInput
+from presentation_agent.llm_client import LLMClient, prepare_response_models
+from presentation_agent.models import (
+    BatchImageEvaluation,
+    ExportResult,
+    PresentationManuscript,
+    SlideContent,
+    SlideListOutput,
+    SlideWithImage,
+    SpeakerProfile,
+    UserInput,
+)
 from presentation_agent.outline_generator import OutlineGenerator
 from presentation_agent.presentation_targets import (
     compute_presentation_targets,
@@ -19,10 +32,19 @@ from presentation_agent.ppt_exporter import PPTExporter, PPTExporterError
 from presentation_agent.script_exporter import ScriptExporter
 from presentation_agent.script_generator import ScriptGenerator, ScriptGeneratorError
 from presentation_agent.script_reviewer import ScriptReviewer
-from presentation_agent.fact_checker import FactChecker
-from presentation_agent.notes_generator import NotesGenerator
+from presentation_agent.fact_checker import FactChecker, FactCheckReport
+from presentation_agent.notes_generator import NotesGenerator, NotesListOutput
 from presentation_agent.slide_generator import SlideGenerator
 
+# Response models of the stages after the outline; prepared while it runs
+_LATER_RESPONSE_MODELS = (
+    PresentationManuscript,
+    FactCheckReport,
+    SlideListOutput,
+    NotesListOutput,
+    BatchImageEvaluation,
+)
+
 
 class PresentationAgentError(Exception):
     """Base exception for presentation agent failures."""
@@ -30,6 +52,19 @@ class PresentationAgentError(Exception):
     pass
 
 
+@dataclass(slots=True)
+class _RunStages:
+    """Pipeline stages of one run; their in-memory state is never shared."""
+
+    outline_gen: OutlineGenerator
+    script_gen: ScriptGenerator
+    script_reviewer: ScriptReviewer
+    fact_checker: FactChecker
+    slide_gen: SlideGenerator
+    notes_gen: NotesGenerator
+    image_svc: ImageService
+
+
 class PresentationAgent:
     """
     Orchestrates the full presentation generation pipeline.
@@ -44,32 +79,115 @@ class PresentationAgent:
 
     def __init__(self, config: Config) -> None:
         self._config = config
+        # One pooled client for OpenAI and Unsplash: keep-alive connections are
+        # reused across pipeline stages; HTTP/2 multiplexes concurrent calls.
+        self._http = create_async_client(timeout=60.0)
         self._llm = LLMClient(
             api_key=config.openai_api_key,
             model=config.openai_model,
+            http_client=self._http,
+            requests_per_minute=config.openai_requests_per_minute or None,
         )
-        self._outline_gen = OutlineGenerator(self._llm, model=config.outline_model)
-        self._script_gen = ScriptGenerator(self._llm, model=config.manuscript_model)
-        self._script_reviewer = ScriptReviewer(
-            self._llm,
-            evaluate_model=config.script_review_evaluate_model,
-            rewrite_model=config.script_review_rewrite_model,
-        )
-        self._fact_checker = FactChecker(
-            self._llm,
-            model=config.script_review_evaluate_model,
-        )
-        self._slide_gen = SlideGenerator(self._llm, model=config.slide_model)
-        self._notes_gen = NotesGenerator(self._llm, model=config.notes_model)
-        self._image_svc = ImageService(
-            access_key=config.unsplash_access_key,
-            base_url=config.unsplash_base_url,
-            candidates_per_query=3,
-            llm_client=self._llm,
-            vision_model=config.image_vision_model,
-        )
+        # Response caches are content-keyed and safe to share between runs;
+        # the stage objects holding per-run state are built in _new_stages().
+        # LLM output is sampled, so replaying it is opt-in (None: no cache).
+        response_dir = config.cache_dir if config.response_cache else None
+        self._outline_cache = open_disk_cache(response_dir, "outlines")
+        self._manuscript_cache = open_disk_cache(response_dir, "manuscripts")
+        self._review_cache = open_disk_cache(response_dir, "script_reviews")
+        self._slide_cache = open_disk_cache(response_dir, "slides")
+        self._notes_cache = open_disk_cache(response_dir, "speaker_notes")
+        self._fact_check_cache = open_disk_cache(response_dir, "fact_checks")
+        self._image_eval_cache = open_disk_cache(config.cache_dir, "image_evaluations")
         self._exporter = PPTExporter()
         self._script_exporter = ScriptExporter()
+        # Persistent event loop for run(): keeps async HTTP connection pools
+        # (OpenAI, Unsplash) alive across runs instead of per asyncio.run().
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    def _new_stages(self) -> _RunStages:
+        """
+        Fresh stage objects for one run.
+
+        They share only the stateless pieces (HTTP and LLM clients, the
+        content-keyed response caches), so concurrent runs, e.g. from
+        different app sessions, never see each other's in-memory state.
+        """
+        config = self._config
+        return _RunStages(
+            outline_gen=OutlineGenerator(
+                self._llm,
+                model=config.outline_model,
+                cache=self._outline_cache,
+                speculative_retry=config.speed_profile == SPEED_PROFILE_FAST,
+            ),
+            script_gen=ScriptGenerator(
+                self._llm,
+                model=config.manuscript_model,
+                cache=self._manuscript_cache,
+            ),
+            script_reviewer=ScriptReviewer(
+                self._llm,
+                evaluate_model=config.script_review_evaluate_model,
+                rewrite_model=config.script_review_rewrite_model,
+                cache=self._review_cache,
+            ),
+            fact_checker=FactChecker(
+                self._llm,
+                model=config.script_review_evaluate_model,
+                cache=self._fact_check_cache,
+            ),
+            slide_gen=SlideGenerator(
+                self._llm,
+                model=config.slide_model,
+                cache=self._slide_cache,
+            ),
+            notes_gen=NotesGenerator(
+                self._llm,
+                model=config.notes_model,
+                cache=self._notes_cache,
+                adapt_model=config.notes_adapt_model,
+            ),
+            image_svc=ImageService(
+                access_key=config.unsplash_access_key,
+                base_url=config.unsplash_base_url,
+                candidates_per_query=3,
+                llm_client=self._llm,
+                vision_model=config.image_vision_model,
+                http_client=self._http,
+                eval_cache=self._image_eval_cache,
+            ),
+        )
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="presentation-agent-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients."""
+        await self._http.aclose()
+        self._exporter.close()
+
+    def close(self) -> None:
+        """Close HTTP connections and stop the background event loop, if started."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            asyncio.run(self.aclose())
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
 
     def run(
         self,
@@ -79,7 +197,7 @@ class PresentationAgent:
         language: str,
         output_path: Optional[Path | str] = None,
         theme: Optional[str] = None,
-        speaker_profile: Optional[dict] = None,
+        speaker_profile: Optional[SpeakerProfile | dict] = None,
         progress_callback: Optional[Callable[[str, int], None]] = None,
     ) -> ExportResult:
         """
@@ -92,7 +210,8 @@ class PresentationAgent:
             language: Presentation language.
             output_path: Optional path for .pptx file. If None, uses temp file.
             theme: Visual theme.
-            speaker_profile: Optional {"age": int, "role": str?, "experience_level": str?}.
+            speaker_profile: Optional SpeakerProfile, or legacy dict
+                {"age": int, "role": str?, "experience_level": str?}.
 
         Returns:
             ExportResult with output_path, script_path, slide_count, images_included.
@@ -101,7 +220,9 @@ class PresentationAgent:
             PresentationAgentError: On pipeline failure.
         """
         profile = None
-        if speaker_profile and isinstance(speaker_profile, dict) and "age" in speaker_profile:
+        if isinstance(speaker_profile, SpeakerProfile):
+            profile = speaker_profile
+        elif speaker_profile and isinstance(speaker_profile, dict) and "age" in speaker_profile:
             profile = SpeakerProfile(
                 age=speaker_profile["age"],
                 role=speaker_profile.get("role"),
@@ -115,9 +236,26 @@ class PresentationAgent:
             theme=theme or "LIGHT_PROFESSIONAL",
             speaker_profile=profile,
         )
-        return asyncio.run(
-            self._run_async(user_input, output_path, progress_callback)
+        loop = self._get_loop()
+        if self._on_loop_thread(loop):
+            raise PresentationAgentError(
+                "run() would block the agent's own event loop; use 'await generate(...)'"
+            )
+        # Safe from plain threads and from inside another running loop
+        # (Jupyter, FastAPI): the pipeline always runs on the agent's loop.
+        future = asyncio.run_coroutine_threadsafe(
+            self._run_async(user_input, output_path, progress_callback),
+            loop,
         )
+        return future.result()
+
+    @staticmethod
+    def _on_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+        """True if called from a coroutine running on the given loop."""
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
 
     def _report(
         self,
@@ -136,66 +274,93 @@ class PresentationAgent:
         progress_callback: Optional[Callable[[str, int], None]] = None,
     ) -> ExportResult:
         """Internal async pipeline implementation."""
+        stages = self._new_stages()
         try:
             self._report(progress_callback, "Planning structure", 5)
-            outline = await self._outline_gen.generate(user_input)
+            # Schema/validator setup for later stages overlaps the outline call
+            prepare = asyncio.ensure_future(
+                asyncio.to_thread(prepare_response_models, *_LATER_RESPONSE_MODELS)
+            )
+            outline = await stages.outline_gen.generate(user_input)
+            await prepare
 
             self._report(progress_callback, "Writing manuscript", 15)
             try:
-                manuscript = await self._script_gen.generate(outline, user_input)
+                manuscript = await stages.script_gen.generate(outline, user_input)
             except ScriptGeneratorError as e:
                 raise PresentationAgentError(f"Script generation failed: {e}") from e
 
-            self._report(progress_callback, "Reviewing manuscript", 25)
-            manuscript, score = await self._script_reviewer.review_and_improve(
-                manuscript,
-                topic=user_input.topic,
-                audience=user_input.audience,
-                duration_minutes=user_input.duration_minutes,
-                language=user_input.language,
-            )
-            self._report(progress_callback, f"Manuscript approved ({score}/10)", 35)
-            self._report(progress_callback, "Fact-checking", 40)
-            manuscript = await self._fact_checker.fact_check_and_patch(
-                manuscript,
-                topic=user_input.topic,
-                audience=user_input.audience,
-            )
+            # Fact-check patches are minimal and local, so slides can be derived
+            # from the reviewed manuscript while the fact-check runs. Both start
+            # on the unreviewed manuscript alongside the review and are only
+            # redone if the reviewer rewrites it.
+            async def fact_check_and_slides(
+                reviewed: PresentationManuscript,
+            ) -> tuple[PresentationManuscript, list[SlideContent]]:
+                return await asyncio.gather(
+                    stages.fact_checker.fact_check_and_patch(
+                        reviewed,
+                        topic=user_input.topic,
+                        audience=user_input.audience,
+                    ),
+                    self._generate_slides(
+                        stages.slide_gen, reviewed, user_input, progress_callback
+                    ),
+                )
 
-            self._report(progress_callback, "Creating slides", 55)
-            targets = compute_presentation_targets(
-                user_input.duration_minutes, user_input.audience
-            )
-            slides = await self._slide_gen.generate(
-                manuscript,
-                duration_minutes=user_input.duration_minutes,
-                audience=user_input.audience,
+            self._report(
+                progress_callback, "Reviewing, fact-checking and creating slides", 25
             )
-            if not is_slide_count_acceptable(
-                slides, targets["min_slides"], targets["max_slides"]
-            ):
-                self._report(progress_callback, "Adjusting slide count, retrying", 60)
-                slides = await self._slide_gen.generate(
+            _, score, (manuscript, slides) = (
+                await stages.script_reviewer.review_with_speculation(
                     manuscript,
-                    duration_minutes=user_input.duration_minutes,
+                    topic=user_input.topic,
                     audience=user_input.audience,
-                    strict_slide_count_retry=True,
+                    duration_minutes=user_input.duration_minutes,
+                    language=user_input.language,
+                    downstream=fact_check_and_slides,
+                    on_rewrite=lambda: self._report(
+                        progress_callback, "Improving manuscript", 45
+                    ),
+                    speaker_profile=user_input.speaker_profile,
+                )
+            )
+            verdict = "review skipped" if score is None else f"{score}/10"
+            self._report(progress_callback, f"Manuscript approved ({verdict})", 65)
+
+            # Notes need manuscript + slide text; images only need slide titles
+            # and queries. Run both and merge notes into the image slides after.
+            self._report(progress_callback, "Adding speaker notes and images", 70)
+
+            def on_image_done(done: int, total: int) -> None:
+                self._report(
+                    progress_callback,
+                    f"Adding speaker notes and images ({done}/{total})",
+                    70 + 20 * done // total,
                 )
-            self._report(progress_callback, "Adding speaker notes", 70)
-            slides = await self._notes_gen.generate(manuscript, slides)
 
-            self._report(progress_callback, "Selecting images", 80)
-            slides_with_images = await self._image_svc.enrich_slides_with_images(
-                slides
+            notes_by_slide, slides_with_images = await asyncio.gather(
+                stages.notes_gen.generate_notes_map(manuscript, slides),
+                stages.image_svc.enrich_slides_with_images(
+                    slides, on_slide_done=on_image_done
+                ),
             )
+            if notes_by_slide:
+                slides_with_images = [
+                    s
+                    if (notes := notes_by_slide.get(s.slide_number)) is None
+                    else s.model_copy(update={"speaker_notes": notes})
+                    for s in slides_with_images
+                ]
 
             self._report(progress_callback, "Exporting files", 92)
             try:
-                result = self._exporter.export(
+                result = await self._exporter.export_async(
                     slides=slides_with_images,
                     title=manuscript.title,
                     output_path=output_path,
                     theme=user_input.theme,
+                    http_client=self._http,
                 )
             except PPTExporterError as e:
                 raise PresentationAgentError(f"Export failed: {e}") from e
@@ -226,6 +391,39 @@ class PresentationAgent:
         except ValueError as e:
             raise PresentationAgentError(f"LLM response error: {e}") from e
 
+    async def _generate_slides(
+        self,
+        slide_gen: SlideGenerator,
+        manuscript: PresentationManuscript,
+        user_input: UserInput,
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+    ) -> list[SlideContent]:
+        """Generate slides, retrying once with a strict prompt if the count is off."""
+        targets = compute_presentation_targets(
+            user_input.duration_minutes, user_input.audience
+        )
+        # Bounds go into the first call so the strict retry below stays rare.
+        slides = await slide_gen.generate(
+            manuscript,
+            duration_minutes=user_input.duration_minutes,
+            audience=user_input.audience,
+            min_slides=targets["min_slides"],
+            max_slides=targets["max_slides"],
+        )
+        if not is_slide_count_acceptable(
+            slides, targets["min_slides"], targets["max_slides"]
+        ):
+            self._report(progress_callback, "Adjusting slide count, retrying", 60)
+            slides = await slide_gen.generate(
+                manuscript,
+                duration_minutes=user_input.duration_minutes,
+                audience=user_input.audience,
+                strict_slide_count_retry=True,
+                min_slides=targets["min_slides"],
+                max_slides=targets["max_slides"],
+            )
+        return slides
+
     async def generate(
         self,
         user_input: UserInput,
@@ -244,4 +442,12 @@ class PresentationAgent:
         Raises:
             PresentationAgentError: On pipeline failure.
         """
-        return await self._run_async(user_input, output_path)
+        loop = self._get_loop()
+        if self._on_loop_thread(loop):
+            return await self._run_async(user_input, output_path)
+        # Run on the agent's loop so the shared HTTP client stays bound to it.
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(
+                self._run_async(user_input, output_path), loop
+            )
+        )
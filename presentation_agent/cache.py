@@ -0,0 +1,155 @@
+"""Caching helpers for deterministic LLM results (in-process LRU and on-disk)."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Generic, Optional, Protocol, TypeVar
+
+V = TypeVar("V")
+
+
+def content_hash(*parts: Optional[str]) -> str:
+    """Stable SHA-256 key over the given strings (None and "" are distinct)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if part is None:
+            digest.update(b"\x01")
+        else:
+            digest.update(b"\x02")
+            digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+_INLINE_WS_RE = re.compile(r"[ \t\r\f\v]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*")
+
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Canonical spacing for prompt text: single spaces, single blank lines.
+
+    Edits that only touch whitespace then map to the same cache key.
+    """
+    text = _INLINE_WS_RE.sub(" ", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    return "\n".join(line.strip() for line in text.strip().split("\n"))
+
+
+class CacheBackend(Protocol):
+    """String key/value store for cached LLM responses (LRUCache[str], SQLiteCache)."""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str) -> None: ...
+
+
+class LRUCache(Generic[V]):
+    """Small thread-safe LRU mapping with a fixed maximum size."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[str, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[V]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """
+    Persistent string cache backed by a local SQLite file.
+
+    Survives process restarts (warm reruns of the same deck). Entries expire
+    after ttl_seconds. Failures to read/write are swallowed: a cache miss is
+    always a safe answer.
+    """
+
+    def __init__(self, path: str | Path, ttl_seconds: float = 7 * 86400) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        expires_at = time.time() + (self._ttl if ttl_seconds is None else ttl_seconds)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at),
+                )
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+async def cache_get(cache: CacheBackend, key: str) -> Optional[str]:
+    """cache.get for async code: SQLite reads run in a worker thread."""
+    if isinstance(cache, SQLiteCache):
+        return await asyncio.to_thread(cache.get, key)
+    return cache.get(key)
+
+
+async def cache_set(cache: CacheBackend, key: str, value: str) -> None:
+    """cache.set for async code: SQLite writes run in a worker thread."""
+    if isinstance(cache, SQLiteCache):
+        await asyncio.to_thread(cache.set, key, value)
+    else:
+        cache.set(key, value)
+
+
+def open_disk_cache(cache_dir: Optional[str], name: str) -> Optional[SQLiteCache]:
+    """Open <cache_dir>/<name>.sqlite3; None if disabled or not writable."""
+    if not cache_dir:
+        return None
+    try:
+        return SQLiteCache(Path(cache_dir).expanduser() / f"{name}.sqlite3")
+    except (OSError, sqlite3.Error):
+        return None
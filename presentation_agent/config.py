@@ -2,18 +2,40 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
 
 from dotenv import load_dotenv
 
-load_dotenv()
+_dotenv_loaded = False
 
 
-def _model_env(key: str, default: str) -> str:
-    """Read model from env; fallback to OPENAI_MODEL then default."""
-    return os.getenv(key) or os.getenv("OPENAI_MODEL", default)
+def _ensure_dotenv() -> None:
+    """Load .env once per process (on first config access, not at import)."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+# Speed profiles: "balanced" uses the per-task defaults below; "fast" switches
+# every task without its own env override to FAST_PROFILE_MODEL.
+SPEED_PROFILE_BALANCED = "balanced"
+SPEED_PROFILE_FAST = "fast"
+SPEED_PROFILES = (SPEED_PROFILE_BALANCED, SPEED_PROFILE_FAST)
+FAST_PROFILE_MODEL = "gpt-4o-mini"
+
+DEFAULT_CACHE_DIR = "~/.cache/presentation_agent"
+DEFAULT_REQUESTS_PER_MINUTE = 500
+
+
+def _model_env(key: str, default: str, speed_profile: str = SPEED_PROFILE_BALANCED) -> str:
+    """Read model from env; fallback to OPENAI_MODEL (or the fast model) then default."""
+    if speed_profile == SPEED_PROFILE_FAST:
+        return os.environ.get(key) or FAST_PROFILE_MODEL
+    return os.environ.get(key) or os.environ.get("OPENAI_MODEL", default)
 
 
 @dataclass(frozen=True)
@@ -31,13 +53,50 @@ class Config:
     script_review_rewrite_model: str = "gpt-5"
     slide_model: str = "gpt-4o"
     notes_model: str = "gpt-5-mini"
+    # Opt-in cheaper model adapting existing notes when only the slides
+    # changed; None always writes notes with notes_model
+    notes_adapt_model: Optional[str] = None
     image_vision_model: str = "gpt-4o"
+    speed_profile: str = SPEED_PROFILE_BALANCED
+    # Directory of the persistent caches; empty disables all of them
+    cache_dir: str = DEFAULT_CACHE_DIR
+    # Replay cached outlines, manuscripts, reviews, fact-checks, slides and
+    # notes for identical prompts (opt-in, for iterating on layout); image
+    # evaluations are cached whenever cache_dir is set
+    response_cache: bool = False
+    # Client-side pacing of OpenAI requests; 0 disables it
+    openai_requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE
 
     @classmethod
-    def from_env(cls) -> Config:
-        """Load configuration from environment variables."""
-        openai_key = os.getenv("OPENAI_API_KEY")
-        unsplash_key = os.getenv("UNSPLASH_ACCESS_KEY")
+    @functools.lru_cache(maxsize=len(SPEED_PROFILES) + 1)
+    def from_env(cls, speed_profile: Optional[str] = None) -> Config:
+        """
+        Load configuration from environment variables.
+
+        Cached per process and speed profile: the environment is read once and
+        the frozen Config is shared. Missing keys raise and are not cached.
+
+        Args:
+            speed_profile: "balanced" or "fast"; defaults to SPEED_PROFILE env.
+        """
+        _ensure_dotenv()
+        env = os.environ
+        profile = (
+            speed_profile or env.get("SPEED_PROFILE") or SPEED_PROFILE_BALANCED
+        ).lower().strip()
+        if profile not in SPEED_PROFILES:
+            raise ValueError(
+                f"Unknown SPEED_PROFILE {profile!r}. Use one of: {', '.join(SPEED_PROFILES)}."
+            )
+        rpm_raw = env.get("OPENAI_REQUESTS_PER_MINUTE", "").strip()
+        try:
+            rpm = int(rpm_raw) if rpm_raw else DEFAULT_REQUESTS_PER_MINUTE
+        except ValueError:
+            raise ValueError(
+                f"OPENAI_REQUESTS_PER_MINUTE must be an integer, got {rpm_raw!r}."
+            ) from None
+        openai_key = env.get("OPENAI_API_KEY")
+        unsplash_key = env.get("UNSPLASH_ACCESS_KEY")
 
         if not openai_key:
             raise ValueError(
@@ -51,19 +110,27 @@ class Config:
         return cls(
             openai_api_key=openai_key,
             unsplash_access_key=unsplash_key,
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-5"),
-            unsplash_base_url=os.getenv(
+            openai_model=env.get("OPENAI_MODEL", "gpt-5"),
+            unsplash_base_url=env.get(
                 "UNSPLASH_BASE_URL", "https://api.unsplash.com"
             ),
-            outline_model=_model_env("OPENAI_MODEL_OUTLINE", "gpt-4o"),
-            manuscript_model=_model_env("OPENAI_MODEL_MANUSCRIPT", "gpt-5"),
+            outline_model=_model_env("OPENAI_MODEL_OUTLINE", "gpt-4o", profile),
+            manuscript_model=_model_env("OPENAI_MODEL_MANUSCRIPT", "gpt-5", profile),
             script_review_evaluate_model=_model_env(
-                "OPENAI_MODEL_SCRIPT_REVIEW_EVALUATE", "gpt-5-mini"
+                "OPENAI_MODEL_SCRIPT_REVIEW_EVALUATE", "gpt-5-mini", profile
             ),
             script_review_rewrite_model=_model_env(
-                "OPENAI_MODEL_SCRIPT_REVIEW_REWRITE", "gpt-5"
+                "OPENAI_MODEL_SCRIPT_REVIEW_REWRITE", "gpt-5", profile
+            ),
+            slide_model=_model_env("OPENAI_MODEL_SLIDES", "gpt-4o", profile),
+            notes_model=_model_env("OPENAI_MODEL_NOTES", "gpt-5-mini", profile),
+            notes_adapt_model=env.get("OPENAI_MODEL_NOTES_ADAPT") or None,
+            image_vision_model=_model_env(
+                "OPENAI_MODEL_IMAGE_VISION", "gpt-4o", profile
             ),
-            slide_model=_model_env("OPENAI_MODEL_SLIDES", "gpt-4o"),
-            notes_model=_model_env("OPENAI_MODEL_NOTES", "gpt-5-mini"),
-            image_vision_model=_model_env("OPENAI_MODEL_IMAGE_VISION", "gpt-4o"),
+            speed_profile=profile,
+            cache_dir=env.get("PRESENTATION_AGENT_CACHE_DIR", DEFAULT_CACHE_DIR),
+            response_cache=env.get("PRESENTATION_AGENT_CACHE", "").strip().lower()
+            in ("1", "true", "yes"),
+            openai_requests_per_minute=max(rpm, 0),
         )
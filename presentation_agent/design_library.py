@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, Optional
 
 from pptx.util import Inches, Pt
 
@@ -66,7 +67,7 @@ class LayoutType(str, Enum):
     CONCLUSION = "conclusion"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlaceholderBox:
     """Content area with position and size (inches)."""
 
@@ -74,13 +75,22 @@ class PlaceholderBox:
     top: float
     width: float
     height: float
+    _inches: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Boxes are immutable, so the EMU conversion is done once here.
+        object.__setattr__(
+            self,
+            "_inches",
+            (Inches(self.left), Inches(self.top), Inches(self.width), Inches(self.height)),
+        )
 
     @property
     def inches(self) -> tuple:
-        return (Inches(self.left), Inches(self.top), Inches(self.width), Inches(self.height))
+        return self._inches
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LayoutTemplate:
     """Slide template definition."""
 
@@ -96,8 +106,8 @@ class LayoutTemplate:
     hero_full_image: bool = False
 
 
-# Template definitions
-TEMPLATES = {
+# Template definitions (read-only)
+TEMPLATES: Mapping[LayoutType, LayoutTemplate] = MappingProxyType({
     LayoutType.TITLE_SLIDE: LayoutTemplate(
         name=LayoutType.TITLE_SLIDE,
         title_area=PlaceholderBox(0.59, 2.6, 12.15, 1.6),
@@ -160,11 +170,78 @@ TEMPLATES = {
         body_area=PlaceholderBox(0.59, 1.6, 12.15, 5.2),
         accent_left=True,
     ),
-}
+})
 
 
 # --- Layout Selection ---
 
+# Slide position in the deck
+_POS_FIRST = "first"
+_POS_LAST = "last"
+_POS_MID = "mid"
+
+
+def _bullets_bucket(bullet_count: int) -> int:
+    """0: ≤1 bullet, 1: 2 bullets, 2: 3 bullets, 3: 4+ bullets."""
+    if bullet_count <= 1:
+        return 0
+    if bullet_count <= 2:
+        return 1
+    if bullet_count <= 3:
+        return 2
+    return 3
+
+
+# (position, has_image, bullets_bucket) → layout
+_LAYOUT_LUT: Mapping[tuple[str, bool, int], LayoutType] = MappingProxyType({
+    **{(_POS_FIRST, True, b): LayoutType.HERO_BACKGROUND for b in range(4)},
+    **{(_POS_FIRST, False, b): LayoutType.BOLD_SECTION_DIVIDER for b in range(4)},
+    **{(_POS_LAST, img, b): LayoutType.CONCLUSION for img in (True, False) for b in range(4)},
+    (_POS_MID, True, 0): LayoutType.HERO_RIGHT,
+    (_POS_MID, True, 1): LayoutType.HERO_RIGHT,
+    (_POS_MID, True, 2): LayoutType.TWO_COLUMN,
+    (_POS_MID, True, 3): LayoutType.TWO_COLUMN,
+    (_POS_MID, False, 0): LayoutType.MINIMAL_TEXT,
+    (_POS_MID, False, 1): LayoutType.MINIMAL_TEXT,
+    (_POS_MID, False, 2): LayoutType.ACCENT_LEFT_LAYOUT,
+    (_POS_MID, False, 3): LayoutType.CARD_LAYOUT,
+})
+
+# Slide feature bits: is_first (bit 4) | is_last (bit 3) | has_image (bit 2) | bullets_bucket (bits 0-1)
+_BIT_FIRST = 1 << 4
+_BIT_LAST = 1 << 3
+_BIT_IMAGE = 1 << 2
+
+
+def _slide_key(slide: "SlideWithImage", slide_index: int, total_slides: int) -> int:
+    """Pack slide features into a 5-bit index into _LAYOUT_LUT_ARRAY."""
+    key = _bullets_bucket(len(slide.bullet_points) if slide.bullet_points else 0)
+    if slide_index == 0:
+        key |= _BIT_FIRST
+    if slide_index == total_slides - 1:
+        key |= _BIT_LAST
+    if slide.image_url:
+        key |= _BIT_IMAGE
+    return key
+
+
+def _layout_for_key(key: int) -> LayoutType:
+    """Resolve a packed key via _LAYOUT_LUT (first slide wins over last)."""
+    if key & _BIT_FIRST:
+        position = _POS_FIRST
+    elif key & _BIT_LAST:
+        position = _POS_LAST
+    else:
+        position = _POS_MID
+    return _LAYOUT_LUT.get(
+        (position, bool(key & _BIT_IMAGE), key & 0b11),
+        LayoutType.ACCENT_LEFT_LAYOUT,
+    )
+
+
+# Every 5-bit key resolved once at import; select_layout is a tuple index.
+_LAYOUT_LUT_ARRAY: tuple[LayoutType, ...] = tuple(_layout_for_key(k) for k in range(32))
+
 
 def select_layout(
     slide: "SlideWithImage",
@@ -172,38 +249,16 @@ def select_layout(
     total_slides: int,
 ) -> LayoutType:
     """
-    Select layout based on content.
-    - Section start → BOLD_SECTION_DIVIDER
-    - Image + few bullets → HERO_RIGHT or IMAGE_FOCUS
-    - Dense bullets (4+) → CARD_LAYOUT
-    - First slide (intro) → BOLD_SECTION_DIVIDER
+    Select layout based on content (see _LAYOUT_LUT).
+    - First slide (intro) → HERO_BACKGROUND with image, else BOLD_SECTION_DIVIDER
     - Last slide → CONCLUSION (ACCENT_LEFT)
-    - Standard → TITLE_AND_BULLETS or ACCENT_LEFT_LAYOUT
+    - Image + few bullets (≤2) → HERO_RIGHT, else TWO_COLUMN
+    - Dense bullets (4+) → CARD_LAYOUT
+    - Few bullets (≤2) → MINIMAL_TEXT
+    - Standard → ACCENT_LEFT_LAYOUT
     """
     try:
-        is_first = slide_index == 0
-        is_last = slide_index == total_slides - 1
-        has_image = bool(slide.image_url)
-        bullet_count = len(slide.bullet_points) if slide.bullet_points else 0
-
-        if is_first:
-            if has_image:
-                return LayoutType.HERO_BACKGROUND
-            return LayoutType.BOLD_SECTION_DIVIDER
-        if is_last:
-            return LayoutType.CONCLUSION
-        if has_image and bullet_count <= 2:
-            return LayoutType.HERO_RIGHT
-        if has_image and bullet_count <= 1:
-            return LayoutType.IMAGE_FOCUS
-        if has_image:
-            return LayoutType.TWO_COLUMN
-        if bullet_count >= 4:
-            return LayoutType.CARD_LAYOUT
-        if bullet_count <= 2:
-            return LayoutType.MINIMAL_TEXT
-
-        return LayoutType.ACCENT_LEFT_LAYOUT
+        return _LAYOUT_LUT_ARRAY[_slide_key(slide, slide_index, total_slides)]
     except Exception:
         return LayoutType.TITLE_AND_BULLETS
 
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+import re
 from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from presentation_agent.cache import CacheBackend, LRUCache
 from presentation_agent.llm_client import LLMClient
 from presentation_agent.models import (
     ManuscriptSection,
@@ -40,6 +44,63 @@ class FactCheckReport(BaseModel):
     issues: list[FactCheckIssue] = Field(default_factory=list)
 
 
+_SYSTEM_PROMPT = (
+    "You are a careful fact-checker for presentation scripts. "
+    "Analyze the manuscript sentence by sentence. "
+    "Identify ONLY: factually incorrect statements, potentially misleading claims, "
+    "outdated information, or unverifiable claims presented as facts. "
+    "Output valid JSON. "
+    "For each issue, original_text MUST be an exact verbatim copy of the problematic "
+    "phrase or sentence as it appears in the manuscript (so it can be replaced). "
+    "corrected_text must be a minimal replacement that fixes the issue while preserving "
+    "tone, style, and length as much as possible. "
+    "Prefer widely accepted general knowledge. If unsure, rephrase more cautiously "
+    "rather than fabricate. Do not invent precise statistics unless certain."
+)
+
+# Max sections fact-checked in parallel
+DEFAULT_SECTION_CONCURRENCY = 4
+
+# Manuscripts shorter than this (in characters) are not worth an LLM call
+MIN_FACT_CHECK_CHARS = 200
+
+
+def _build_patch_pattern(corrections: dict[str, str]) -> re.Pattern[str]:
+    """
+    Compile all originals into one alternation for a single left-to-right scan.
+
+    Longer originals come first so that, at a given position, the longest
+    matching original wins over a shorter prefix of it.
+    """
+    ordered = sorted(corrections, key=len, reverse=True)
+    return re.compile("|".join(re.escape(text) for text in ordered))
+
+
+def _patch_content(
+    content: str,
+    pattern: re.Pattern[str],
+    corrections: dict[str, str],
+) -> str:
+    """Replace the first non-overlapping occurrence of each original in one pass."""
+    parts: list[str] = []
+    cursor = 0
+    used: set[str] = set()
+    for match in pattern.finditer(content):
+        original = match.group(0)
+        if original in used:
+            continue
+        used.add(original)
+        parts.append(content[cursor:match.start()])
+        parts.append(corrections[original])
+        cursor = match.end()
+        if len(used) == len(corrections):
+            break
+    if not parts:
+        return content
+    parts.append(content[cursor:])
+    return "".join(parts)
+
+
 class FactChecker:
     """
     Reviews manuscript for factual issues and applies minimal patches only.
@@ -51,51 +112,46 @@ class FactChecker:
         self,
         llm_client: LLMClient,
         model: Optional[str] = None,
+        max_concurrency: int = DEFAULT_SECTION_CONCURRENCY,
+        cache: Optional[CacheBackend] = None,
     ) -> None:
         self._llm = llm_client
         self._model = model
+        self._sem = asyncio.Semaphore(max_concurrency)
+        # Section reports are keyed by their prompt (model, topic, audience,
+        # section text), so a cache shared across runs is safe
+        self._cache: CacheBackend = cache if cache is not None else LRUCache(maxsize=256)
 
     def _manuscript_text(self, manuscript: PresentationManuscript) -> str:
         """Full manuscript as single text for analysis."""
-        return "\n\n".join(
-            f"## {s.name}\n{s.content}" for s in manuscript.sections
-        )
+        buf = io.StringIO()
+        for i, s in enumerate(manuscript.sections):
+            if i:
+                buf.write("\n\n")
+            buf.write("## ")
+            buf.write(s.name)
+            buf.write("\n")
+            buf.write(s.content)
+        return buf.getvalue()
 
-    async def fact_check(
+    async def _fact_check_section(
         self,
-        manuscript: PresentationManuscript,
+        section: ManuscriptSection,
         topic: str,
         audience: str,
     ) -> FactCheckReport:
-        """
-        Analyze manuscript and return structured list of factual issues.
-
-        Returns report with empty issues list if nothing to correct.
-        """
-        full_text = self._manuscript_text(manuscript)
-        system_prompt = (
-            "You are a careful fact-checker for presentation scripts. "
-            "Analyze the manuscript sentence by sentence. "
-            "Identify ONLY: factually incorrect statements, potentially misleading claims, "
-            "outdated information, or unverifiable claims presented as facts. "
-            "Output valid JSON. "
-            "For each issue, original_text MUST be an exact verbatim copy of the problematic "
-            "phrase or sentence as it appears in the manuscript (so it can be replaced). "
-            "corrected_text must be a minimal replacement that fixes the issue while preserving "
-            "tone, style, and length as much as possible. "
-            "Prefer widely accepted general knowledge. If unsure, rephrase more cautiously "
-            "rather than fabricate. Do not invent precise statistics unless certain."
-        )
+        """Fact-check a single section; identical sections reuse the cached report."""
+        section_text = f"## {section.name}\n{section.content}"
         prompt = f"""
 Topic: {topic}
 Audience: {audience}
 
-Manuscript to analyze:
+Manuscript section to analyze:
 
-{full_text}
+{section_text}
 
 Identify factual issues only. For each issue provide:
-- "original_text": exact verbatim quote from the manuscript (required for replacement)
+- "original_text": exact verbatim quote from the section (required for replacement)
 - "issue_type": one of "incorrect" | "misleading" | "outdated" | "unverifiable"
 - "explanation": brief explanation
 - "corrected_text": minimal replacement, same tone and style
@@ -105,13 +161,46 @@ If no issues are found, return: {{ "issues": [] }}
 Output a JSON object with "issues": array of the above objects.
 """
 
-        result = await self._llm.generate_structured(
-            prompt=prompt,
-            response_model=FactCheckReport,
-            system_prompt=system_prompt,
-            model=self._model,
+        async with self._sem:
+            return await self._llm.generate_structured(
+                prompt=prompt,
+                response_model=FactCheckReport,
+                system_prompt=_SYSTEM_PROMPT,
+                model=self._model,
+                cache=self._cache,
+            )
+
+    async def fact_check(
+        self,
+        manuscript: PresentationManuscript,
+        topic: str,
+        audience: str,
+    ) -> FactCheckReport:
+        """
+        Analyze manuscript and return structured list of factual issues.
+
+        Sections are checked concurrently (bounded) and their issues merged,
+        so latency follows the longest section rather than the whole text.
+        Sections that fail contribute no issues; raises only if all fail.
+        Returns report with empty issues list if nothing to correct; empty or
+        tiny manuscripts (under MIN_FACT_CHECK_CHARS) are not sent at all.
+        """
+        sections = [s for s in manuscript.sections if s.content.strip()]
+        if not sections:
+            return FactCheckReport()
+        full_text = self._manuscript_text(manuscript)
+        if len(full_text.strip()) < MIN_FACT_CHECK_CHARS:
+            return FactCheckReport()
+        results = await asyncio.gather(
+            *(self._fact_check_section(s, topic, audience) for s in sections),
+            return_exceptions=True,
+        )
+        reports = [r for r in results if isinstance(r, FactCheckReport)]
+        if results and not reports:
+            raise results[0]
+        return FactCheckReport(
+            issues=[issue for report in reports for issue in report.issues]
         )
-        return result
 
     def apply_patches(
         self,
@@ -123,26 +212,38 @@ Output a JSON object with "issues": array of the above objects.
 
         Keeps surrounding text, tone, style, and structure unchanged.
         Replaces at most one occurrence per (section, issue) to avoid over-replace.
+        All quotes are compiled into one pattern and each section is scanned
+        once; corrected text is never re-matched by a later issue.
         """
         if not report.issues:
             return manuscript
 
+        # original_text → corrected_text; the first issue for a given quote wins
+        corrections: dict[str, str] = {}
+        for issue in report.issues:
+            if issue.original_text:
+                corrections.setdefault(issue.original_text, issue.corrected_text)
+        if not corrections:
+            return manuscript
+
+        pattern = _build_patch_pattern(corrections)
         new_sections: list[ManuscriptSection] = []
+        changed = False
         for section in manuscript.sections:
-            content = section.content
-            for issue in report.issues:
-                if not issue.original_text or issue.original_text not in content:
-                    continue
-                content = content.replace(
-                    issue.original_text,
-                    issue.corrected_text,
-                    1,
-                )
+            content = _patch_content(section.content, pattern, corrections)
+            if content is section.content:
+                # No quote occurs in this section: keep it as-is
+                new_sections.append(section)
+                continue
+            changed = True
+            # Inputs come from validated models: skip re-validation
             new_sections.append(
-                ManuscriptSection(name=section.name, content=content)
+                ManuscriptSection.model_construct(name=section.name, content=content)
             )
+        if not changed:
+            return manuscript
 
-        return PresentationManuscript(
+        return PresentationManuscript.model_construct(
             title=manuscript.title,
             sections=new_sections,
         )
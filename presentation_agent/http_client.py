@@ -0,0 +1,34 @@
+"""Shared async HTTP client factory (connection pooling, optional HTTP/2)."""
+
+from __future__ import annotations
+
+import httpx
+
+DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (httpx[http2])."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_async_client(timeout: float = 60.0) -> httpx.AsyncClient:
+    """Pooled keep-alive client; HTTP/2 multiplexes concurrent requests when available."""
+    return httpx.AsyncClient(
+        http2=http2_available(),
+        limits=DEFAULT_LIMITS,
+        timeout=timeout,
+    )
+
+
+def create_client(timeout: float = 10.0) -> httpx.Client:
+    """Blocking counterpart of create_async_client (thread-safe, pooled)."""
+    return httpx.Client(
+        http2=http2_available(),
+        limits=DEFAULT_LIMITS,
+        timeout=timeout,
+    )
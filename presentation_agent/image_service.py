@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Optional
 
 import httpx
 
-from presentation_agent.models import ImageEvaluation, SlideContent, SlideWithImage
+from presentation_agent.cache import LRUCache, SQLiteCache, content_hash
+from presentation_agent.http_client import create_async_client
+from presentation_agent.models import (
+    BatchImageEvaluation,
+    ImageEvaluation,
+    SlideContent,
+    SlideWithImage,
+)
 
 
 class ImageServiceError(Exception):
@@ -19,15 +26,28 @@ class ImageServiceError(Exception):
 
 _MIN_WIDTH = 800
 
+# Max in-flight calls across all slides (avoids 429 bursts on large decks)
+DEFAULT_VISION_CONCURRENCY = 10
+DEFAULT_HTTP_CONCURRENCY = 5
+
 
 @dataclass
-class _Candidate:
-    """Image candidate with URL and metadata."""
+class _Candidates:
+    """Image candidates as parallel lists (index i describes one candidate)."""
+
+    urls: list[str] = field(default_factory=list)
+    widths: list[int] = field(default_factory=list)
+    heights: list[int] = field(default_factory=list)
+    raws: list[dict[str, Any]] = field(default_factory=list)
+
+    def append(self, url: str, width: int, height: int, raw: dict[str, Any]) -> None:
+        self.urls.append(url)
+        self.widths.append(width)
+        self.heights.append(height)
+        self.raws.append(raw)
 
-    url: str
-    width: int
-    height: int
-    raw: dict[str, Any]
+    def __len__(self) -> int:
+        return len(self.urls)
 
 
 def _metadata_select_best(results: list[dict[str, Any]]) -> Optional[str]:
@@ -50,9 +70,10 @@ def _metadata_select_best(results: list[dict[str, Any]]) -> Optional[str]:
     return None
 
 
-def _parse_candidates(results: list[dict[str, Any]]) -> list[_Candidate]:
-    """Parse Unsplash results into candidates."""
-    candidates: list[_Candidate] = []
+def _parse_candidates(results: list[dict[str, Any]]) -> _Candidates:
+    """Parse Unsplash results into candidates (landscape first, else any)."""
+    candidates = _Candidates()
+    fallback = _Candidates()
     for r in results:
         urls = r.get("urls", {})
         url = urls.get("regular") or urls.get("small")
@@ -60,22 +81,11 @@ def _parse_candidates(results: list[dict[str, Any]]) -> list[_Candidate]:
             continue
         width = r.get("width", 0) or 0
         height = r.get("height", 0) or 0
-        if width < height:
-            continue
-        candidates.append(_Candidate(url=url, width=width, height=height, raw=r))
-    if not candidates:
-        for r in results:
-            url = r.get("urls", {}).get("regular") or r.get("urls", {}).get("small")
-            if url:
-                candidates.append(
-                    _Candidate(
-                        url=url,
-                        width=r.get("width", 0),
-                        height=r.get("height", 0),
-                        raw=r,
-                    )
-                )
-    return candidates
+        if width >= height:
+            candidates.append(url, width, height, r)
+        elif not candidates:
+            fallback.append(url, width, height, r)
+    return candidates if candidates else fallback
 
 
 class ImageService:
@@ -88,51 +98,148 @@ class ImageService:
         candidates_per_query: int = 3,
         llm_client: Optional[Any] = None,
         vision_model: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        eval_cache: Optional[SQLiteCache] = None,
+        vision_concurrency: int = DEFAULT_VISION_CONCURRENCY,
+        http_concurrency: int = DEFAULT_HTTP_CONCURRENCY,
     ) -> None:
         self._access_key = access_key
+        self._auth_headers = {"Authorization": f"Client-ID {access_key}"}
+        # Long-lived pooled client: injected (shared) or owned by this service
+        self._owns_http = http_client is None
+        self._http = http_client or create_async_client(timeout=15.0)
+        self._eval_cache = eval_cache
+        self._llm_sem = asyncio.Semaphore(vision_concurrency)
+        self._http_sem = asyncio.Semaphore(http_concurrency)
         self._base_url = base_url.rstrip("/")
         self._candidates_per_query = candidates_per_query
         self._llm = llm_client
         self._vision_model = vision_model
+        # Selected URL per (query, prefer_background); in-flight lookups are
+        # shared so duplicate queries within a deck cost one search
+        self._query_cache: LRUCache[str] = LRUCache(maxsize=256)
+        self._query_inflight: dict[tuple[str, bool], asyncio.Task[Optional[str]]] = {}
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this service created it."""
+        if self._owns_http:
+            await self._http.aclose()
+
+    def _eval_cache_key(self, url: str, slide_topic: str, slide_context: str) -> str:
+        return content_hash(self._vision_model, url, slide_topic, slide_context)
+
+    def _cached_evaluations(self, cache_keys: list[str]) -> list[Optional[ImageEvaluation]]:
+        """Look up several evaluations (blocking SQLite reads; run off the loop)."""
+        results: list[Optional[ImageEvaluation]] = []
+        for cache_key in cache_keys:
+            cached = self._eval_cache.get(cache_key)
+            try:
+                results.append(
+                    None if cached is None else ImageEvaluation.model_validate_json(cached)
+                )
+            except ValueError:
+                results.append(None)
+        return results
+
+    def _store_evaluations(self, entries: list[tuple[str, str]]) -> None:
+        """Persist (cache key, evaluation JSON) pairs (blocking; run off the loop)."""
+        for cache_key, value in entries:
+            self._eval_cache.set(cache_key, value)
 
-    async def _evaluate_candidate(
+    async def _evaluate_candidates(
         self,
-        candidate: _Candidate,
+        candidates: _Candidates,
         slide_topic: str,
         slide_context: str,
-    ) -> Optional[ImageEvaluation]:
-        """Evaluate single candidate with vision. Returns None on failure."""
+    ) -> tuple[list[tuple[int, ImageEvaluation]], Optional[int]]:
+        """
+        Evaluate all candidates of a slide with one batch vision call.
+
+        Candidates already in the evaluation cache are not sent again.
+        Returns ([(candidate index, evaluation)], index of the model's pick
+        or None); failures yield no evaluations.
+        """
         if not self._llm:
-            return None
+            return [], None
+        evaluations: list[tuple[int, ImageEvaluation]] = []
+        pending: list[int] = []
+        cache_keys: list[Optional[str]] = []
+        if self._eval_cache is not None:
+            all_keys = [
+                self._eval_cache_key(url, slide_topic, slide_context)
+                for url in candidates.urls
+            ]
+            # SQLite is blocking: one worker-thread hop for the whole slide
+            cached = await asyncio.to_thread(self._cached_evaluations, all_keys)
+        else:
+            all_keys = [None] * len(candidates.urls)
+            cached = [None] * len(candidates.urls)
+        for i, (cache_key, hit) in enumerate(zip(all_keys, cached)):
+            if hit is not None:
+                evaluations.append((i, hit))
+                continue
+            pending.append(i)
+            cache_keys.append(cache_key)
+        if not pending:
+            return evaluations, None
+
         try:
-            return await self._llm.evaluate_image_vision(
-                image_url=candidate.url,
-                slide_topic=slide_topic,
-                slide_context=slide_context,
-                response_model=ImageEvaluation,
-                model=self._vision_model,
-            )
+            async with self._llm_sem:
+                batch = await self._llm.evaluate_images_vision_batch(
+                    image_urls=[candidates.urls[i] for i in pending],
+                    slide_topic=slide_topic,
+                    slide_context=slide_context,
+                    response_model=BatchImageEvaluation,
+                    model=self._vision_model,
+                )
         except Exception:
-            return None
+            return evaluations, None
+
+        seen: set[int] = set()
+        to_store: list[tuple[str, str]] = []
+        for item in batch.evaluations:
+            if item.index >= len(pending) or item.index in seen:
+                continue
+            seen.add(item.index)
+            evaluation = ImageEvaluation(
+                score=item.score,
+                reason=item.reason,
+                suitable_as_background=item.suitable_as_background,
+            )
+            evaluations.append((pending[item.index], evaluation))
+            cache_key = cache_keys[item.index]
+            if cache_key is not None:
+                to_store.append((cache_key, evaluation.model_dump_json()))
+        if to_store:
+            await asyncio.to_thread(self._store_evaluations, to_store)
+        pick = pending[batch.best_index] if batch.best_index < len(pending) else None
+        return evaluations, pick
 
     def _select_best_by_vision(
         self,
-        candidates: list[_Candidate],
-        evaluations: list[tuple[_Candidate, ImageEvaluation]],
+        candidates: _Candidates,
+        evaluations: list[tuple[int, ImageEvaluation]],
         prefer_background: bool,
+        model_pick: Optional[int] = None,
     ) -> Optional[str]:
-        """Select best image from vision evaluations."""
+        """Select best image from vision evaluations (model's pick breaks ties)."""
         if not evaluations:
             return None
 
-        def key(item: tuple[_Candidate, ImageEvaluation]) -> tuple:
-            ev = item[1]
+        # Single pass, comparing scalars: (score + background bonus, score, pick)
+        best_idx = -1
+        best_total = best_score = -1
+        best_is_pick = False
+        for idx, ev in evaluations:
             score = ev.score
-            bg_bonus = 1 if (prefer_background and ev.suitable_as_background) else 0
-            return (score + bg_bonus * 2, score)
-
-        best = max(evaluations, key=key)
-        return best[0].url
+            total = score + 2 if prefer_background and ev.suitable_as_background else score
+            is_pick = idx == model_pick
+            if total > best_total or (
+                total == best_total
+                and (score > best_score or (score == best_score and is_pick and not best_is_pick))
+            ):
+                best_idx, best_total, best_score, best_is_pick = idx, total, score, is_pick
+        return candidates.urls[best_idx]
 
     async def fetch_image_for_query(
         self,
@@ -152,21 +259,53 @@ class ImageService:
 
         Returns:
             Best image URL or None.
+
+        A query seen before (with the same prefer_background) reuses the
+        earlier selection without another search or vision call.
         """
+        key = (query, prefer_background)
+        cache_key = f"{int(prefer_background)}:{query}"
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        task = self._query_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._search_and_select(
+                    query, slide_topic, slide_context, prefer_background
+                )
+            )
+            self._query_inflight[key] = task
+            task.add_done_callback(lambda _: self._query_inflight.pop(key, None))
+        # Shielded: one cancelled caller must not cancel the shared lookup
+        image_url = await asyncio.shield(task)
+        if image_url is not None:
+            self._query_cache.set(cache_key, image_url)
+        return image_url
+
+    async def _search_and_select(
+        self,
+        query: str,
+        slide_topic: str,
+        slide_context: str,
+        prefer_background: bool,
+    ) -> Optional[str]:
+        """Search Unsplash for query and pick the best candidate."""
         url = f"{self._base_url}/search/photos"
         params = {
             "query": query,
             "per_page": self._candidates_per_query,
             "orientation": "landscape",
         }
-        headers = {"Authorization": f"Client-ID {self._access_key}"}
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            try:
-                response = await client.get(url, params=params, headers=headers)
-                response.raise_for_status()
-            except httpx.HTTPError as e:
-                raise ImageServiceError(f"Unsplash API error: {e}") from e
+        try:
+            async with self._http_sem:
+                response = await self._http.get(
+                    url, params=params, headers=self._auth_headers, timeout=15.0
+                )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise ImageServiceError(f"Unsplash API error: {e}") from e
 
         data = response.json()
         results = data.get("results", [])[:3]
@@ -181,33 +320,30 @@ class ImageService:
         context = slide_context or f"Search: {query}"
 
         if self._llm and candidates:
-            ev_results = await asyncio.gather(
-                *[self._evaluate_candidate(c, topic, context) for c in candidates],
-                return_exceptions=True,
+            evaluations, model_pick = await self._evaluate_candidates(
+                candidates, topic, context
             )
-            evaluations: list[tuple[_Candidate, ImageEvaluation]] = []
-            for c, ev in zip(candidates, ev_results):
-                if isinstance(ev, ImageEvaluation):
-                    evaluations.append((c, ev))
-
             if evaluations:
                 return self._select_best_by_vision(
-                    candidates, evaluations, prefer_background
+                    candidates, evaluations, prefer_background, model_pick
                 )
 
         return _metadata_select_best(results)
 
-    async def enrich_slides_with_images(
+    async def iter_slides_with_images(
         self,
         slides: list[SlideContent],
-    ) -> list[SlideWithImage]:
+    ) -> AsyncIterator[tuple[int, SlideWithImage]]:
         """
-        Fetch and select images for slides with image_query.
+        Fetch and select images for slides, yielding each slide as it finishes.
 
+        Yields (index in slides, enriched slide) in completion order, so
+        consumers can start on finished slides before the slowest fetch.
         Uses vision evaluation when available. First slide prefers
         suitable_as_background for hero layouts.
         """
-        async def process_slide(i: int, slide: SlideContent) -> SlideWithImage:
+        async def process_slide(i: int, slide: SlideContent) -> tuple[int, SlideWithImage]:
+            # Never raises: any failure just leaves the slide without an image
             image_url: Optional[str] = None
             if slide.image_query and slide.image_query.strip():
                 try:
@@ -224,7 +360,8 @@ class ImageService:
                 except Exception:
                     image_url = None
 
-            return SlideWithImage(
+            # Fields come from a validated SlideContent: skip re-validation
+            return i, SlideWithImage.model_construct(
                 slide_number=slide.slide_number,
                 title=slide.title,
                 bullet_points=slide.bullet_points,
@@ -233,26 +370,33 @@ class ImageService:
                 image_query=slide.image_query,
             )
 
-        results = await asyncio.gather(
-            *[process_slide(i, s) for i, s in enumerate(slides)],
-            return_exceptions=True,
-        )
-
-        enriched: list[SlideWithImage] = []
-        for i, r in enumerate(results):
-            if isinstance(r, Exception):
-                slide = slides[i]
-                enriched.append(
-                    SlideWithImage(
-                        slide_number=slide.slide_number,
-                        title=slide.title,
-                        bullet_points=slide.bullet_points,
-                        speaker_notes=slide.speaker_notes,
-                        image_url=None,
-                        image_query=slide.image_query,
-                    )
-                )
-            else:
-                enriched.append(r)
+        tasks = [
+            asyncio.ensure_future(process_slide(i, s)) for i, s in enumerate(slides)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early (or was cancelled): drop remaining fetches
+            for task in tasks:
+                task.cancel()
 
-        return enriched
+    async def enrich_slides_with_images(
+        self,
+        slides: list[SlideContent],
+        on_slide_done: Optional[Callable[[int, int], None]] = None,
+    ) -> list[SlideWithImage]:
+        """
+        Fetch and select images for slides with image_query.
+
+        Slides are processed concurrently and returned in input order.
+        on_slide_done(done, total) is called as each slide finishes.
+        """
+        enriched: list[Optional[SlideWithImage]] = [None] * len(slides)
+        done = 0
+        async for i, slide in self.iter_slides_with_images(slides):
+            enriched[i] = slide
+            done += 1
+            if on_slide_done:
+                on_slide_done(done, len(slides))
+        return enriched  # type: ignore[return-value]
@@ -2,21 +2,220 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
-from typing import TypeVar
+from typing import Any, Optional, TypeVar
 
-from openai import AsyncOpenAI
-from pydantic import BaseModel
+import httpx
+from openai import AsyncOpenAI, BadRequestError
+from pydantic import BaseModel, TypeAdapter
+
+from presentation_agent.cache import CacheBackend, cache_get, cache_set, content_hash
+from presentation_agent.rate_limit import AsyncRateLimiter
 
 T = TypeVar("T", bound=BaseModel)
 
 
+@functools.lru_cache(maxsize=None)
+def _schema_for(response_model: type[BaseModel]) -> dict[str, Any]:
+    """JSON schema of a response model, generated once per class."""
+    return response_model.model_json_schema()
+
+
+# Model families that accept response_format={"type": "json_schema", "strict": True}
+_JSON_SCHEMA_MODEL_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")
+# Early gpt-4o snapshot predates structured outputs
+_JSON_SCHEMA_UNSUPPORTED = frozenset({"gpt-4o-2024-05-13"})
+
+_JSON_OBJECT_FORMAT: dict[str, Any] = {"type": "json_object"}
+
+
+def _supports_json_schema(model: str) -> bool:
+    """Whether the model supports strict structured outputs."""
+    return model not in _JSON_SCHEMA_UNSUPPORTED and model.startswith(
+        _JSON_SCHEMA_MODEL_PREFIXES
+    )
+
+
+def _is_response_format_error(error: BadRequestError) -> bool:
+    """Whether a 400 rejects the json_schema response_format (not the input)."""
+    param = str(getattr(error, "param", None) or "")
+    if param.startswith("response_format"):
+        return True
+    message = str(getattr(error, "message", "") or error).lower()
+    return "response_format" in message or "json_schema" in message
+
+
+def _make_strict(node: Any) -> None:
+    """
+    Rewrite a pydantic JSON schema in place for strict mode.
+
+    Strict mode needs every property listed in "required", no extra
+    properties and no "default" keywords; fields with defaults are still
+    optional on our side because the pydantic model fills them in.
+    """
+    if isinstance(node, dict):
+        node.pop("default", None)
+        properties = node.get("properties")
+        if isinstance(properties, dict):
+            node["required"] = list(properties)
+            node["additionalProperties"] = False
+            for sub in properties.values():
+                _make_strict(sub)
+        for key, value in node.items():
+            if key != "properties":
+                _make_strict(value)
+    elif isinstance(node, list):
+        for item in node:
+            _make_strict(item)
+
+
+@functools.lru_cache(maxsize=None)
+def _json_schema_format_for(response_model: type[BaseModel]) -> dict[str, Any]:
+    """response_format payload for strict structured outputs, built once per class."""
+    schema = copy.deepcopy(_schema_for(response_model))
+    _make_strict(schema)
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": response_model.__name__,
+            "schema": schema,
+            "strict": True,
+        },
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_fingerprint(response_model: type[BaseModel]) -> str:
+    """Hash of the response schema, so cached responses expire when it changes."""
+    return content_hash(json.dumps(_schema_for(response_model), sort_keys=True))
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter_for(response_model: type[T]) -> TypeAdapter[T]:
+    """Validator for a response model, built once per class."""
+    return TypeAdapter(response_model)
+
+
+def _response_cache_key(
+    model: str,
+    system_prompt: str | None,
+    prompt: str,
+    response_model: type[BaseModel],
+) -> str:
+    return content_hash(model, system_prompt, prompt, _schema_fingerprint(response_model))
+
+
+@functools.lru_cache(maxsize=128)
+def _prompt_cache_key(system_prompt: str, schema_name: str) -> str:
+    """
+    Routing hint for OpenAI prompt caching: calls sharing a system prompt and
+    schema share their prompt prefix, so they should land on the same cache.
+    """
+    return content_hash(system_prompt, schema_name)[:32]
+
+
+def prepare_response_models(*response_models: type[BaseModel]) -> None:
+    """
+    Build and cache schema, response_format and validator for each model.
+
+    Normally done lazily on first use; calling this ahead of time (e.g. in a
+    worker thread while an earlier request is in flight) keeps that work off
+    the request path.
+    """
+    for response_model in response_models:
+        _json_schema_format_for(response_model)
+        _schema_fingerprint(response_model)
+        _adapter_for(response_model)
+
+
 class LLMClient:
     """Async OpenAI client for structured JSON outputs."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o") -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        http_client: Optional[httpx.AsyncClient] = None,
+        requests_per_minute: Optional[int] = None,
+    ) -> None:
+        self._client = AsyncOpenAI(api_key=api_key, http_client=http_client)
         self._model = model
+        # Paces all completions (text and vision); None disables pacing
+        self._limiter = (
+            AsyncRateLimiter(requests_per_minute, 60.0) if requests_per_minute else None
+        )
+        # (model, schema name) pairs the API rejected json_schema for
+        self._json_schema_rejected: set[tuple[str, str]] = set()
+
+    async def _create_json_completion(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        json_schema_format: dict[str, Any],
+        prompt_cache_key: Optional[str] = None,
+    ) -> Any:
+        """
+        Chat completion constrained to a strict json_schema response_format.
+
+        Uses strict structured outputs where the model supports them, so the
+        reply always matches the schema; falls back to json_object mode for
+        older models or schemas the API refuses. prompt_cache_key, if given,
+        groups requests with a common prefix for provider-side prompt caching.
+        """
+        if self._limiter is not None:
+            await self._limiter.acquire()
+        extra_body = {"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None
+        key = (model, json_schema_format["json_schema"]["name"])
+        if _supports_json_schema(model) and key not in self._json_schema_rejected:
+            try:
+                return await self._client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    response_format=json_schema_format,
+                    extra_body=extra_body,
+                )
+            except BadRequestError as e:
+                # Other 400s (context length, bad image URL, content filter)
+                # say nothing about schema support: don't disable it for them
+                if not _is_response_format_error(e):
+                    raise
+                self._json_schema_rejected.add(key)
+            # The fallback is a second request and needs its own token
+            if self._limiter is not None:
+                await self._limiter.acquire()
+        return await self._client.chat.completions.create(
+            model=model,
+            messages=messages,
+            response_format=_JSON_OBJECT_FORMAT,
+            extra_body=extra_body,
+        )
+
+    async def get_cached_structured(
+        self,
+        prompt: str,
+        response_model: type[T],
+        system_prompt: str | None,
+        model: str | None,
+        cache: CacheBackend,
+    ) -> Optional[T]:
+        """Cached result generate_structured would return for these args, or None."""
+        model = model or self._model
+        cache_key = _response_cache_key(model, system_prompt, prompt, response_model)
+        return await self._cached_response(cache, cache_key, response_model)
+
+    @staticmethod
+    async def _cached_response(
+        cache: CacheBackend, cache_key: str, response_model: type[T]
+    ) -> Optional[T]:
+        cached = await cache_get(cache, cache_key)
+        if cached is None:
+            return None
+        try:
+            return _adapter_for(response_model).validate_json(cached)
+        except ValueError:
+            return None
 
     async def generate_structured(
         self,
@@ -24,6 +223,7 @@ class LLMClient:
         response_model: type[T],
         system_prompt: str | None = None,
         model: str | None = None,
+        cache: Optional[CacheBackend] = None,
     ) -> T:
         """
         Generate a structured response from the LLM, parsed into a Pydantic model.
@@ -33,6 +233,8 @@ class LLMClient:
             response_model: Pydantic model class for the expected JSON structure.
             system_prompt: Optional system message.
             model: Override model for this call (default: client default).
+            cache: Optional response cache keyed on (model, system prompt,
+                prompt, schema); a hit skips the API call.
 
         Returns:
             Parsed instance of response_model.
@@ -40,27 +242,97 @@ class LLMClient:
         Raises:
             ValueError: If the response cannot be parsed into the model.
         """
+        model = model or self._model
+        adapter = _adapter_for(response_model)
+        cache_key = None
+        if cache is not None:
+            cache_key = _response_cache_key(model, system_prompt, prompt, response_model)
+            cached = await self._cached_response(cache, cache_key, response_model)
+            if cached is not None:
+                return cached
+
         messages = []
+        prompt_cache_key = None
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
+            prompt_cache_key = _prompt_cache_key(system_prompt, response_model.__name__)
         messages.append({"role": "user", "content": prompt})
 
-        response = await self._client.chat.completions.create(
-            model=model or self._model,
-            messages=messages,
-            response_format={"type": "json_object"},
+        response = await self._create_json_completion(
+            model, messages, _json_schema_format_for(response_model), prompt_cache_key
         )
 
         content = response.choices[0].message.content
         if not content:
             raise ValueError("Empty response from LLM")
 
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON from LLM: {e}") from e
+        # Parse + validate in one pass; pydantic.ValidationError is a ValueError
+        # and covers malformed JSON as well as schema mismatches.
+        result = adapter.validate_json(content)
+        if cache_key is not None:
+            await cache_set(cache, cache_key, content)
+        return result
+
+    async def generate_json(
+        self,
+        prompt: str,
+        json_schema_format: dict[str, Any],
+        system_prompt: str | None = None,
+        model: str | None = None,
+        cache: Optional[CacheBackend] = None,
+    ) -> dict[str, Any]:
+        """
+        Generate a JSON object without pydantic validation.
+
+        For small throwaway results the caller unpacks itself; the schema is
+        still enforced server-side where strict outputs are supported.
+
+        Args:
+            prompt: User prompt.
+            json_schema_format: Strict json_schema response_format payload.
+            system_prompt: Optional system message.
+            model: Override model for this call (default: client default).
+            cache: Optional response cache keyed on (model, system prompt,
+                prompt, schema); a hit skips the API call.
+
+        Returns:
+            The decoded JSON object.
+
+        Raises:
+            ValueError: If the response is empty or not a JSON object.
+        """
+        model = model or self._model
+        cache_key = None
+        if cache is not None:
+            cache_key = content_hash(
+                model, system_prompt, prompt, json.dumps(json_schema_format, sort_keys=True)
+            )
+            cached = await cache_get(cache, cache_key)
+            if cached is not None:
+                return json.loads(cached)
+
+        messages = []
+        prompt_cache_key = None
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+            prompt_cache_key = _prompt_cache_key(
+                system_prompt, json_schema_format["json_schema"]["name"]
+            )
+        messages.append({"role": "user", "content": prompt})
 
-        return response_model.model_validate(data)
+        response = await self._create_json_completion(
+            model, messages, json_schema_format, prompt_cache_key
+        )
+
+        content = response.choices[0].message.content
+        if not content:
+            raise ValueError("Empty response from LLM")
+        data = json.loads(content)  # JSONDecodeError is a ValueError
+        if not isinstance(data, dict):
+            raise ValueError("LLM response is not a JSON object")
+        if cache_key is not None:
+            await cache_set(cache, cache_key, content)
+        return data
 
     async def evaluate_image_vision(
         self,
@@ -108,19 +380,78 @@ Output JSON with:
             {"type": "image_url", "image_url": {"url": image_url, "detail": "low"}},
         ]
 
-        response = await self._client.chat.completions.create(
-            model=model or self._model,
-            messages=[{"role": "user", "content": content}],
-            response_format={"type": "json_object"},
+        response = await self._create_json_completion(
+            model or self._model,
+            [{"role": "user", "content": content}],
+            _json_schema_format_for(response_model),
         )
 
         raw = response.choices[0].message.content
         if not raw:
             raise ValueError("Empty vision response")
 
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON from vision: {e}") from e
+        return _adapter_for(response_model).validate_json(raw)
+
+    async def evaluate_images_vision_batch(
+        self,
+        image_urls: list[str],
+        slide_topic: str,
+        slide_context: str,
+        response_model: type[T],
+        model: str | None = None,
+    ) -> T:
+        """
+        Evaluate several candidate images for one slide in a single vision call.
+
+        Args:
+            image_urls: URLs of the images, referenced by 0-based index.
+            slide_topic: Slide title/topic.
+            slide_context: Additional context (bullets, etc.).
+            response_model: Pydantic model for the batch result
+                (evaluations with "index", plus "best_index").
+            model: Override model for this call (must be vision-capable).
+
+        Returns:
+            Parsed batch evaluation result.
+        """
+        prompt = f"""
+Evaluate these {len(image_urls)} images for use in a professional presentation slide.
+The images are numbered 0 to {len(image_urls) - 1} in the order given.
+
+Slide topic: {slide_topic}
+Context: {slide_context}
+
+Assess each image on:
+- Relevance to the topic (does it match the subject?)
+- Clarity of subject (is the main subject clear?)
+- Visual quality (sharpness, composition)
+- Presentation suitability (professional, not distracting)
+- Background usability (could work as slide background?)
+- Absence of distracting elements (text, logos, clutter)
+
+Output JSON with:
+- "evaluations": list with one entry per image, each with
+  - "index": int (0-based image number)
+  - "score": int 0-10 (10 = perfect for presentation)
+  - "reason": string (brief explanation)
+  - "suitable_as_background": bool (true if image could work as full-slide background)
+- "best_index": int (index of the best image for this slide)
+"""
+
+        content: list[dict[str, Any]] = [{"type": "text", "text": prompt}]
+        content.extend(
+            {"type": "image_url", "image_url": {"url": url, "detail": "low"}}
+            for url in image_urls
+        )
+
+        response = await self._create_json_completion(
+            model or self._model,
+            [{"role": "user", "content": content}],
+            _json_schema_format_for(response_model),
+        )
+
+        raw = response.choices[0].message.content
+        if not raw:
+            raise ValueError("Empty vision response")
 
-        return response_model.model_validate(data)
+        return _adapter_for(response_model).validate_json(raw)
@@ -6,9 +6,6 @@ import argparse
 import sys
 from pathlib import Path
 
-from presentation_agent.agent import PresentationAgent, PresentationAgentError
-from presentation_agent.config import Config
-
 
 def main() -> None:
     """Runnable entry point with CLI arguments."""
@@ -68,6 +65,10 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    # Deferred: openai/httpx/pptx/docx are only needed once we actually run
+    from presentation_agent.agent import PresentationAgent, PresentationAgentError
+    from presentation_agent.config import Config
+
     try:
         config = Config.from_env()
     except ValueError as e:
@@ -86,6 +86,12 @@ class PresentationOutline(BaseModel):
         description="Outline sections",
     )
 
+    def sections_as_prompt_block(self) -> str:
+        """One "- title: point, point" line per section (computed on each call)."""
+        return "\n".join(
+            f"- {s.title}: {', '.join(s.points)}" for s in self.sections
+        )
+
 
 # --- Script ---
 
@@ -129,6 +135,12 @@ class PresentationManuscript(BaseModel):
         """Return the complete manuscript as continuous text."""
         return "\n\n".join(s.content for s in self.sections)
 
+    def sections_as_prompt_block(self) -> str:
+        """Named section blocks separated by "---" rules (computed on each call)."""
+        return "\n\n---\n\n".join(
+            f"{s.name}:\n{s.content}" for s in self.sections
+        )
+
 
 # --- Slide Structure ---
 
@@ -174,6 +186,19 @@ class ImageEvaluation(BaseModel):
     suitable_as_background: bool = Field(default=False)
 
 
+class IndexedImageEvaluation(ImageEvaluation):
+    """Evaluation of one image within a batch vision request."""
+
+    index: int = Field(..., ge=0, description="0-based position of the image in the request")
+
+
+class BatchImageEvaluation(BaseModel):
+    """Vision evaluation of several candidate images in one request."""
+
+    evaluations: list[IndexedImageEvaluation] = Field(default_factory=list)
+    best_index: int = Field(default=0, ge=0, description="Index of the best image")
+
+
 class ExportResult(BaseModel):
     """Result of the presentation export."""
 
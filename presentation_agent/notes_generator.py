@@ -2,10 +2,164 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import asyncio
+import re
+from typing import AsyncIterator, Optional
 
+from pydantic import BaseModel, Field, TypeAdapter
+
+from presentation_agent.cache import (
+    CacheBackend,
+    LRUCache,
+    cache_get,
+    cache_set,
+    content_hash,
+    normalize_whitespace,
+)
 from presentation_agent.llm_client import LLMClient
-from presentation_agent.models import PresentationManuscript, SlideContent
+from presentation_agent.models import (
+    ManuscriptSection,
+    PresentationManuscript,
+    SlideContent,
+)
+
+# Slides per notes request for long decks (chunks are sent concurrently)
+NOTES_CHUNK_SIZE = 5
+
+# Manuscript characters per notes request (~4 chars/token → ~6k tokens);
+# longer inputs are condensed extractively before prompting
+NOTES_CONTENT_CHAR_BUDGET = 24_000
+
+_NOTES_SYSTEM_PROMPT = (
+    "You are an expert at creating presenter support materials. "
+    "SPEAKER NOTES ARE FOR THE PRESENTER. Slides are for the audience. "
+    "Generate 2-5 concise notes per slide: key arguments, reminders. "
+    "Short sentences or phrases. NOT full paragraphs. "
+    "Output valid JSON."
+)
+
+_NOTES_PROMPT_TEMPLATE = """
+Generate SPEAKER NOTES for each slide. Notes are for the presenter, not the audience.
+
+LAYER 2 — SPEAKER NOTES:
+- 2-5 concise notes per slide
+- Key arguments only
+- Helpful reminders for the presenter
+- Short sentences or phrases allowed
+- NOT full paragraphs{bullet_rule}
+
+Manuscript:
+{content_str}
+
+{slides_heading}
+{slides_str}
+
+For each slide, output:
+- "slide_number": int
+- "speaker_notes": string with 2-5 concise notes, newline-separated or as bullet points
+
+Output a JSON object with "notes": array of these objects.
+Match notes to the manuscript content relevant to each slide.
+"""
+
+_NOTES_ADAPT_PROMPT_TEMPLATE = """
+Speaker notes were already written for the slides below, from this same
+presentation manuscript, in an earlier slide list. Adapt them to the current
+slides.
+
+Keep each existing note where it still fits its slide; adjust it only where
+the manuscript shows the slide now covers different points. Notes are for the
+presenter, 2-5 per slide, NOT full paragraphs.
+
+Manuscript:
+{content_str}
+
+Existing notes (by slide title):
+{reference_str}
+
+Current slides:
+{slides_str}
+
+For each current slide, output:
+- "slide_number": int
+- "speaker_notes": string with 2-5 concise notes, newline-separated or as bullet points
+
+Output a JSON object with "notes": array of these objects.
+"""
+
+# Prompt wording for whether slide bullets are sent: never refer the model
+# to bullets it cannot see
+_BULLET_RULE = "\n- NOT identical to slide bullets (slides are separate, for audience)"
+_SLIDES_HEADING_WITH_BULLETS = "Slide structure (bullets already defined for audience):"
+_SLIDES_HEADING_TITLES_ONLY = "Slides (titles only):"
+
+# Notes already written for a manuscript: slide title → notes
+_REFERENCE_ADAPTER: TypeAdapter[dict[str, str]] = TypeAdapter(dict[str, str])
+
+_WORD_RE = re.compile(r"\w{4,}")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _keywords(text: str) -> set[str]:
+    return {w.casefold() for w in _WORD_RE.findall(text)}
+
+
+def _condense(text: str, max_chars: int) -> str:
+    """
+    Keep the most representative sentences of text within max_chars.
+
+    Sentences are scored by the mean frequency of their words across the
+    text (a cheap extractive summary) and kept in their original order.
+    """
+    if len(text) <= max_chars:
+        return text
+    sentences = _SENTENCE_SPLIT_RE.split(text)
+    freq: dict[str, int] = {}
+    sentence_words: list[list[str]] = []
+    for sentence in sentences:
+        words = [w.casefold() for w in _WORD_RE.findall(sentence)]
+        sentence_words.append(words)
+        for w in words:
+            freq[w] = freq.get(w, 0) + 1
+    scores = [
+        sum(freq[w] for w in words) / len(words) if words else 0.0
+        for words in sentence_words
+    ]
+    keep: set[int] = set()
+    used = 0
+    for i in sorted(range(len(sentences)), key=scores.__getitem__, reverse=True):
+        size = len(sentences[i]) + 1
+        if used + size > max_chars:
+            continue
+        keep.add(i)
+        used += size
+    return " ".join([sentences[i] for i in sorted(keep)])
+
+
+def _sections_for_slides(
+    sections: list[ManuscriptSection],
+    slides: list[SlideContent],
+) -> list[ManuscriptSection]:
+    """
+    Manuscript sections relevant to a chunk of slides.
+
+    Slides follow the manuscript order, so this takes the contiguous span of
+    sections sharing keywords with the slide titles/bullets. Falls back to
+    all sections if nothing matches.
+    """
+    slide_words: set[str] = set()
+    for slide in slides:
+        slide_words |= _keywords(slide.title)
+        for bullet in slide.bullet_points:
+            slide_words |= _keywords(bullet)
+    matching = [
+        i
+        for i, section in enumerate(sections)
+        if not slide_words.isdisjoint(_keywords(f"{section.name} {section.content}"))
+    ]
+    if not matching:
+        return sections
+    return sections[matching[0]:matching[-1] + 1]
 
 
 class SlideNotesOutput(BaseModel):
@@ -29,9 +183,26 @@ class NotesGenerator:
     Output: 2-5 concise reminders per slide, derived from manuscript.
     """
 
-    def __init__(self, llm_client: LLMClient, model: str | None = None) -> None:
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        model: str | None = None,
+        cache: Optional[CacheBackend] = None,
+        include_bullets: bool = False,
+        adapt_model: str | None = None,
+    ) -> None:
         self._llm = llm_client
         self._model = model
+        # Opt-in cheaper model that adapts notes already written for the same
+        # manuscript and slide titles to a changed slide list; None always
+        # uses model.
+        self._adapt_model = adapt_model
+        # Notes come from the manuscript; slide titles are enough to align
+        # them, so bullets are only sent when explicitly requested.
+        self._include_bullets = include_bullets
+        self._condensed_cache: LRUCache[str] = LRUCache(maxsize=128)
+        # Identical (manuscript, slides) prompts reuse the previous notes
+        self._cache: CacheBackend = cache if cache is not None else LRUCache(maxsize=32)
 
     async def generate(
         self,
@@ -51,70 +222,232 @@ class NotesGenerator:
         Returns:
             Slides with speaker_notes filled in.
         """
-        system_prompt = (
-            "You are an expert at creating presenter support materials. "
-            "SPEAKER NOTES ARE FOR THE PRESENTER. Slides are for the audience. "
-            "Generate 2-5 concise notes per slide: key arguments, reminders. "
-            "Short sentences or phrases. NOT full paragraphs. "
-            "NOT identical to slide bullets. Output valid JSON."
-        )
-
-        content_str = "\n\n---\n\n".join(
-            f"{s.name}:\n{s.content}" for s in manuscript.sections
-        )
+        if not slides or not manuscript.sections:
+            return slides  # Nothing to annotate / derive notes from
+        notes_by_slide = await self.generate_notes_map(manuscript, slides)
+        if notes_by_slide is None:
+            return slides  # Continue with slides only if notes fail
 
-        slides_str = "\n".join(
-            f"- Slide {s.slide_number}: {s.title} | bullets: {s.bullet_points}"
+        # Merge notes into slides; slides without notes are reused as-is
+        return [
+            s
+            if (notes := notes_by_slide.get(s.slide_number)) is None
+            else s.model_copy(update={"speaker_notes": notes})
             for s in slides
+        ]
+
+    async def generate_notes_map(
+        self,
+        manuscript: PresentationManuscript,
+        slides: list[SlideContent],
+    ) -> Optional[dict[int, str]]:
+        """
+        Generate speaker notes keyed by slide_number without touching the slides.
+
+        Lets callers merge notes post-hoc into slides produced concurrently
+        (e.g. image enrichment). Returns None if notes generation fails.
+        """
+        if not slides:
+            return {}
+        notes_by_slide: dict[int, str] = {}
+        any_ok = False
+        async for _, notes in self._iter_chunk_notes(manuscript, slides):
+            if notes is not None:
+                any_ok = True
+                notes_by_slide.update(notes)
+        return notes_by_slide if any_ok else None
+
+    async def _iter_chunk_notes(
+        self,
+        manuscript: PresentationManuscript,
+        slides: list[SlideContent],
+    ) -> AsyncIterator[tuple[list[SlideContent], Optional[dict[int, str]]]]:
+        """
+        Yield (slide chunk, notes or None) as each notes request finishes.
+
+        Long decks are split into chunks of NOTES_CHUNK_SIZE slides, each sent
+        concurrently with the manuscript sections it covers.
+        """
+        if not slides:
+            return
+        sections = manuscript.sections
+        if not sections:
+            # No manuscript to derive notes from: skip the LLM round-trip
+            yield slides, {}
+            return
+        reference_key = self._reference_key(sections)
+        if len(slides) <= NOTES_CHUNK_SIZE:
+            yield slides, await self._request_notes(sections, slides, reference_key)
+            return
+
+        async def chunk_notes(
+            chunk: list[SlideContent],
+        ) -> tuple[list[SlideContent], Optional[dict[int, str]]]:
+            chunk_sections = _sections_for_slides(sections, chunk)
+            notes = await self._request_notes(chunk_sections, chunk, reference_key)
+            if notes is None and len(chunk_sections) < len(sections):
+                # Section matching may have been too narrow: retry with all of
+                # it, written fresh (the reference may now hold sibling chunks)
+                notes = await self._request_notes(
+                    sections, chunk, reference_key, allow_adapt=False
+                )
+            return chunk, notes
+
+        tasks = [
+            asyncio.ensure_future(chunk_notes(slides[i:i + NOTES_CHUNK_SIZE]))
+            for i in range(0, len(slides), NOTES_CHUNK_SIZE)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _condensed(self, content: str, max_chars: int) -> str:
+        """_condense with results memoized per (content, budget)."""
+        key = content_hash(content, str(max_chars))
+        cached = self._condensed_cache.get(key)
+        if cached is None:
+            cached = _condense(content, max_chars)
+            self._condensed_cache.set(key, cached)
+        return cached
+
+    def _reference_key(self, sections: list[ManuscriptSection]) -> str:
+        """Cache key of the notes written so far for this manuscript, by slide title."""
+        parts = [part for s in sections for part in (s.name, normalize_whitespace(s.content))]
+        return content_hash("notes-reference", self._model, *parts)
+
+    async def _remember_notes(
+        self,
+        reference_key: str,
+        slides: list[SlideContent],
+        notes: dict[int, str],
+    ) -> None:
+        """Add the slides' notes to the manuscript's reference (read-merge-write)."""
+        reference = await self._load_reference(reference_key) or {}
+        for s in slides:
+            if notes.get(s.slide_number):
+                reference[s.title] = notes[s.slide_number]
+        await cache_set(
+            self._cache, reference_key, _REFERENCE_ADAPTER.dump_json(reference).decode()
         )
 
-        prompt = f"""
-Generate SPEAKER NOTES for each slide. Notes are for the presenter, not the audience.
+    async def _load_reference(self, reference_key: str) -> Optional[dict[str, str]]:
+        raw = await cache_get(self._cache, reference_key)
+        if raw is None:
+            return None
+        try:
+            return _REFERENCE_ADAPTER.validate_json(raw)
+        except ValueError:
+            return None
 
-LAYER 2 — SPEAKER NOTES:
-- 2-5 concise notes per slide
-- Key arguments only
-- Helpful reminders for the presenter
-- Short sentences or phrases allowed
-- NOT full paragraphs
-- NOT identical to slide bullets (slides are separate, for audience)
+    async def _adapt_notes(
+        self,
+        reference_key: str,
+        content_str: str,
+        slides: list[SlideContent],
+    ) -> Optional[dict[int, str]]:
+        """
+        Adapt previously written notes to these slides with adapt_model.
 
-Manuscript:
-{content_str}
+        Only when every slide title already has notes in the reference: the
+        cheaper model adjusts existing notes, it never writes them from scratch.
+        """
+        reference = await self._load_reference(reference_key)
+        if not reference or any(s.title not in reference for s in slides):
+            return None
+        reference_str = "\n".join(
+            [f"- {s.title}: {' / '.join(reference[s.title].splitlines())}" for s in slides]
+        )
+        slides_str = "\n".join([f"- Slide {s.slide_number}: {s.title}" for s in slides])
+        try:
+            result = await self._llm.generate_structured(
+                prompt=_NOTES_ADAPT_PROMPT_TEMPLATE.format(
+                    content_str=content_str,
+                    reference_str=reference_str,
+                    slides_str=slides_str,
+                ),
+                response_model=NotesListOutput,
+                system_prompt=_NOTES_SYSTEM_PROMPT,
+                model=self._adapt_model,
+                cache=self._cache,
+            )
+        except Exception:
+            return None
+        return {n.slide_number: n.speaker_notes for n in result.notes}
 
-Slide structure (bullets already defined for audience):
-{slides_str}
+    async def _request_notes(
+        self,
+        sections: list[ManuscriptSection],
+        slides: list[SlideContent],
+        reference_key: str,
+        allow_adapt: bool = True,
+    ) -> Optional[dict[int, str]]:
+        """
+        One notes call for the given slides; None on failure.
 
-For each slide, output:
-- "slide_number": int
-- "speaker_notes": string with 2-5 concise notes, newline-separated or as bullet points
+        Cascade: an exact cache hit is returned as-is; otherwise, if notes
+        were already written for these slide titles of this manuscript and
+        adapt_model is set (and allow_adapt), the cheaper model adapts them;
+        otherwise the main model writes them.
+        """
+        # Whitespace-only manuscript edits yield the same prompt (cache hit)
+        contents = [normalize_whitespace(s.content) for s in sections]
+        total = sum(map(len, contents))
+        if total > NOTES_CONTENT_CHAR_BUDGET:
+            # Bounded prompt: each section keeps its share of the budget
+            contents = [
+                self._condensed(c, NOTES_CONTENT_CHAR_BUDGET * len(c) // total)
+                for c in contents
+            ]
+        # Lists, not generators: join sizes the result in one pass
+        content_str = "\n\n---\n\n".join(
+            [s.name + ":\n" + c for s, c in zip(sections, contents)]
+        )
 
-Output a JSON object with "notes": array of these objects.
-Match notes to the manuscript content relevant to each slide.
-"""
+        if self._include_bullets:
+            slides_str = "\n".join(
+                [
+                    f"- Slide {s.slide_number}: {s.title} | bullets: {s.bullet_points}"
+                    for s in slides
+                ]
+            )
+        else:
+            slides_str = "\n".join(
+                [f"- Slide {s.slide_number}: {s.title}" for s in slides]
+            )
+
+        prompt = _NOTES_PROMPT_TEMPLATE.format(
+            content_str=content_str,
+            slides_str=slides_str,
+            bullet_rule=_BULLET_RULE if self._include_bullets else "",
+            slides_heading=(
+                _SLIDES_HEADING_WITH_BULLETS
+                if self._include_bullets
+                else _SLIDES_HEADING_TITLES_ONLY
+            ),
+        )
+
+        if allow_adapt and self._adapt_model and await self._llm.get_cached_structured(
+            prompt, NotesListOutput, _NOTES_SYSTEM_PROMPT, self._model, self._cache
+        ) is None:
+            adapted = await self._adapt_notes(reference_key, content_str, slides)
+            if adapted:
+                return adapted
 
         try:
             result = await self._llm.generate_structured(
                 prompt=prompt,
                 response_model=NotesListOutput,
-                system_prompt=system_prompt,
+                system_prompt=_NOTES_SYSTEM_PROMPT,
                 model=self._model,
+                cache=self._cache,
             )
         except Exception:
-            return slides  # Continue with slides only if notes fail
+            return None
 
-        # Merge notes into slides
-        notes_by_slide = {n.slide_number: n.speaker_notes for n in result.notes}
-        enriched: list[SlideContent] = []
-        for s in slides:
-            notes = notes_by_slide.get(s.slide_number, "")
-            enriched.append(
-                SlideContent(
-                    slide_number=s.slide_number,
-                    title=s.title,
-                    bullet_points=s.bullet_points,
-                    speaker_notes=notes,
-                    image_query=s.image_query,
-                )
-            )
-        return enriched
+        notes = {n.slide_number: n.speaker_notes for n in result.notes}
+        if self._adapt_model:
+            await self._remember_notes(reference_key, slides, notes)
+        return notes
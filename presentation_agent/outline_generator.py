@@ -2,17 +2,108 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Optional
+
+from presentation_agent.cache import (
+    CacheBackend,
+    LRUCache,
+    cache_get,
+    cache_set,
+    content_hash,
+    normalize_whitespace,
+)
 from presentation_agent.llm_client import LLMClient
 from presentation_agent.models import PresentationOutline, UserInput
 from presentation_agent.presentation_targets import compute_presentation_targets
 
 
+_SYSTEM_PROMPT_BASE = (
+    "You are an expert presentation designer. "
+    "Generate a clear, professional outline with logical narrative structure. "
+    "Output valid JSON matching the exact schema. "
+)
+
+# System prompt per strict flag (built once, not per call)
+_SYSTEM_PROMPTS = {
+    False: _SYSTEM_PROMPT_BASE,
+    True: _SYSTEM_PROMPT_BASE
+    + (
+        "CRITICAL: Include exactly 'type', 'title', and 'points' for each section. "
+        "Type must be one of: introduction, main, conclusion. "
+    ),
+}
+
+_STRICT_STRUCTURE_NOTES = """
+STRICT SCHEMA - each section MUST have:
+- "type": exactly "introduction" OR "main" OR "conclusion"
+- "title": string
+- "points": array of 2-4 strings (subpoints)
+"""
+
+_PROMPT_TEMPLATE = """
+Create a presentation outline with this structure:
+
+1. INTRODUCTION (type: "introduction") — ~10-15% of content
+   - Hook / attention grabber
+   - Context / background
+   - Purpose of the presentation
+   - Optional: agenda
+
+2. MAIN CONTENT (type: "main") — {main_section_count} sections, ~70-80% of content
+   - Each section: one core idea, 2-4 subpoints
+   - Logical progression
+   - Provide enough subpoints so the presentation can yield {min_slides}-{max_slides} slides total
+
+3. CONCLUSION (type: "conclusion") — ~10-15% of content
+   - Summary of key points
+   - Final takeaway / message
+   - Optional: call to action
+
+Parameters:
+- Topic: {topic}
+- Duration: {duration_minutes} minutes
+- Target slide count: {min_slides}-{max_slides} slides (1-2 slides per minute)
+- Audience: {audience}
+- Language: {language}
+
+AUDIENCE ADAPTATION: Adjust terminology complexity, depth for "{audience}".
+
+DURATION: Outline must support a {duration_minutes}-minute presentation with {min_slides}-{max_slides} slides. Ensure enough substance in main sections.
+{structure_notes}
+
+Output a JSON object:
+```json
+{{
+  "title": "string (presentation title)",
+  "sections": [
+    {{ "type": "introduction", "title": "...", "points": ["...", "..."] }},
+    {{ "type": "main", "title": "...", "points": ["...", "..."] }},
+    {{ "type": "main", "title": "...", "points": ["...", "..."] }},
+    {{ "type": "conclusion", "title": "...", "points": ["...", "..."] }}
+  ]
+}}
+```
+"""
+
+
 class OutlineGenerator:
     """Generates a structured presentation outline with professional narrative structure."""
 
-    def __init__(self, llm_client: LLMClient, model: str | None = None) -> None:
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        model: str | None = None,
+        cache: Optional[CacheBackend] = None,
+        speculative_retry: bool = False,
+    ) -> None:
         self._llm = llm_client
         self._model = model
+        # Race the strict prompt against the normal one instead of retrying
+        # after a failure: one round-trip worst case, at twice the tokens.
+        self._speculative_retry = speculative_retry
+        # Identical inputs reuse the previous outline
+        self._cache: CacheBackend = cache if cache is not None else LRUCache(maxsize=32)
 
     async def generate(self, user_input: UserInput) -> PresentationOutline:
         """
@@ -26,11 +117,63 @@ class OutlineGenerator:
 
         Returns:
             Structured outline with title and typed sections.
+
+        Raises:
+            ValueError: If the topic is blank (checked before any LLM call).
+
+        Outlines are also cached by their prompt slots (topic, duration,
+        audience, language), ignoring case and spacing, so equivalent
+        requests skip the LLM even when the prompt text differs.
         """
+        if not user_input.topic.strip():
+            raise ValueError("Topic must not be empty")
+        slot_key = self._slot_key(user_input)
+        cached = await cache_get(self._cache, slot_key)
+        if cached is not None:
+            try:
+                return PresentationOutline.model_validate_json(cached)
+            except ValueError:
+                pass
+
+        if self._speculative_retry:
+            outline = await self._generate_speculative(user_input)
+        else:
+            try:
+                outline = await self._generate_with_retry(user_input)
+            except ValueError:
+                outline = await self._generate_with_retry(user_input, strict=True)
+        await cache_set(self._cache, slot_key, outline.model_dump_json())
+        return outline
+
+    async def _generate_speculative(self, user_input: UserInput) -> PresentationOutline:
+        """Run normal and strict prompts concurrently; first valid outline wins."""
+        tasks = [
+            asyncio.ensure_future(self._generate_with_retry(user_input, strict=strict))
+            for strict in (False, True)
+        ]
         try:
-            return await self._generate_with_retry(user_input)
-        except ValueError:
-            return await self._generate_with_retry(user_input, strict=True)
+            error: Optional[ValueError] = None
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done
+                except ValueError as e:
+                    error = e
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _slot_key(self, user_input: UserInput) -> str:
+        """Cache key over the only inputs the outline prompt depends on."""
+        return content_hash(
+            "outline-slots",
+            self._model,
+            normalize_whitespace(user_input.topic).casefold(),
+            str(user_input.duration_minutes),
+            normalize_whitespace(user_input.audience).casefold(),
+            normalize_whitespace(user_input.language).casefold(),
+        )
 
     async def _generate_with_retry(
         self,
@@ -45,20 +188,11 @@ class OutlineGenerator:
             response_model=PresentationOutline,
             system_prompt=system_prompt,
             model=self._model,
+            cache=self._cache,
         )
 
     def _build_system_prompt(self, strict: bool) -> str:
-        base = (
-            "You are an expert presentation designer. "
-            "Generate a clear, professional outline with logical narrative structure. "
-            "Output valid JSON matching the exact schema. "
-        )
-        if strict:
-            base += (
-                "CRITICAL: Include exactly 'type', 'title', and 'points' for each section. "
-                "Type must be one of: introduction, main, conclusion. "
-            )
-        return base
+        return _SYSTEM_PROMPTS[strict]
 
     def _build_prompt(self, user_input: UserInput, strict: bool) -> str:
         targets = compute_presentation_targets(
@@ -70,56 +204,14 @@ class OutlineGenerator:
         # Enough main sections so content can map to target slide count (intro ~10-15%, main 70-80%, conclusion ~10-15%)
         main_section_count = max(2, min(8, (target_slides * 3) // 4))
 
-        structure_notes = ""
-        if strict:
-            structure_notes = """
-STRICT SCHEMA - each section MUST have:
-- "type": exactly "introduction" OR "main" OR "conclusion"
-- "title": string
-- "points": array of 2-4 strings (subpoints)
-"""
-
-        return f"""
-Create a presentation outline with this structure:
-
-1. INTRODUCTION (type: "introduction") — ~10-15% of content
-   - Hook / attention grabber
-   - Context / background
-   - Purpose of the presentation
-   - Optional: agenda
-
-2. MAIN CONTENT (type: "main") — {main_section_count} sections, ~70-80% of content
-   - Each section: one core idea, 2-4 subpoints
-   - Logical progression
-   - Provide enough subpoints so the presentation can yield {min_slides}-{max_slides} slides total
-
-3. CONCLUSION (type: "conclusion") — ~10-15% of content
-   - Summary of key points
-   - Final takeaway / message
-   - Optional: call to action
-
-Parameters:
-- Topic: {user_input.topic}
-- Duration: {user_input.duration_minutes} minutes
-- Target slide count: {min_slides}-{max_slides} slides (1-2 slides per minute)
-- Audience: {user_input.audience}
-- Language: {user_input.language}
-
-AUDIENCE ADAPTATION: Adjust terminology complexity, depth for "{user_input.audience}".
-
-DURATION: Outline must support a {user_input.duration_minutes}-minute presentation with {min_slides}-{max_slides} slides. Ensure enough substance in main sections.
-{structure_notes}
-
-Output a JSON object:
-```json
-{{
-  "title": "string (presentation title)",
-  "sections": [
-    {{ "type": "introduction", "title": "...", "points": ["...", "..."] }},
-    {{ "type": "main", "title": "...", "points": ["...", "..."] }},
-    {{ "type": "main", "title": "...", "points": ["...", "..."] }},
-    {{ "type": "conclusion", "title": "...", "points": ["...", "..."] }}
-  ]
-}}
-```
-"""
+        return _PROMPT_TEMPLATE.format(
+            # Canonical spacing so re-typed inputs hit the response cache
+            topic=normalize_whitespace(user_input.topic),
+            audience=normalize_whitespace(user_input.audience),
+            duration_minutes=user_input.duration_minutes,
+            language=user_input.language,
+            min_slides=min_slides,
+            max_slides=max_slides,
+            main_section_count=main_section_count,
+            structure_notes=_STRICT_STRUCTURE_NOTES if strict else "",
+        )
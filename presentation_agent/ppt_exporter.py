@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import io
+import struct
 import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 import httpx
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.util import Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.text.text import _Paragraph
 
 from presentation_agent.design_library import (
     LayoutType,
@@ -30,12 +38,46 @@ from presentation_agent.design_library import (
     BODY_MIN_FONT_SIZE,
     BODY_FONT_REDUCE_IF_BULLETS_ABOVE,
 )
+from presentation_agent.http_client import create_async_client, create_client
 from presentation_agent.models import ExportResult, SlideWithImage
 from presentation_agent.theme_library import get_theme
 
+try:
+    from PIL import Image as _PIL_Image
+except ImportError:  # header sniffing still covers PNG/JPEG
+    _PIL_Image = None
+
+try:
+    from pptx.opc.serialized import PackageWriter as _PackageWriter
+except ImportError:  # older python-pptx: keep prs.save()
+    _PackageWriter = None
+
 # DPI assumption for image size (Pillow default)
 _IMG_DPI = 96.0
 
+# Concurrent image downloads before rendering
+_PREFETCH_WORKERS = 8
+# Read size for streamed image downloads
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+_EMU_PER_INCH = 914400
+
+
+def _emu(inches: float) -> int:
+    """Inches to EMU as a plain int (same value as pptx.util.Inches)."""
+    return int(inches * _EMU_PER_INCH)
+
+
+# Fixed shape sizes in EMU, converted once at import
+_TITLE_AREA_MAX_HEIGHT_EMU = _emu(TITLE_AREA_MAX_HEIGHT)
+_ACCENT_BAR_WIDTH_EMU = _emu(ACCENT_BAR_WIDTH)
+_ACCENT_LINE_HEIGHT_EMU = _emu(ACCENT_LINE_HEIGHT)
+
+# Fixed paragraph spacings (Pt objects are immutable, safe to share)
+_PT_4 = Pt(4)
+_PT_8 = Pt(8)
+_PT_12 = Pt(12)
+
 
 class PPTExporterError(Exception):
     """Raised when PowerPoint export fails."""
@@ -43,14 +85,44 @@ class PPTExporterError(Exception):
     pass
 
 
-def _get_image_size_inches(stream: io.BytesIO) -> Optional[Tuple[float, float]]:
-    """Return (width_inch, height_inch) from image stream; None on failure."""
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers (carry the dimensions); excludes DHT/JPG/DAC
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _sniff_image_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """(width_px, height_px) from PNG/JPEG headers without decoding; None if unknown."""
+    if data[:8] == _PNG_SIGNATURE and data[12:16] == b"IHDR":
+        return struct.unpack(">II", data[16:24])
+    if data[:2] != b"\xff\xd8":
+        return None
+    pos = 2
+    end = len(data)
+    while pos + 9 <= end:
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            h_px, w_px = struct.unpack(">HH", data[pos + 5 : pos + 9])
+            return w_px, h_px
+        (segment_len,) = struct.unpack(">H", data[pos + 2 : pos + 4])
+        pos += 2 + segment_len
+    return None
+
+
+def _get_image_size_inches(data: bytes) -> Optional[Tuple[float, float]]:
+    """Return (width_inch, height_inch) from image bytes; None on failure."""
     try:
-        from PIL import Image
-        stream.seek(0)
-        img = Image.open(stream)
-        w_px, h_px = img.size
-        stream.seek(0)
+        size = _sniff_image_size(data)
+        if size is None:
+            if _PIL_Image is None:
+                return None
+            with _PIL_Image.open(io.BytesIO(data)) as img:
+                size = img.size
+        w_px, h_px = size
         if w_px <= 0 or h_px <= 0:
             return None
         return (w_px / _IMG_DPI, h_px / _IMG_DPI)
@@ -58,87 +130,252 @@ def _get_image_size_inches(stream: io.BytesIO) -> Optional[Tuple[float, float]]:
         return None
 
 
+# Already-compressed media is stored as is; XML gets a fast deflate
+_STORED_MEDIA_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+_XML_COMPRESSLEVEL = 1
+
+
+class _MediaStoredZipWriter:
+    """Physical package writer: deflates XML parts, stores images uncompressed."""
+
+    def __init__(self, path: str) -> None:
+        self._zipf = zipfile.ZipFile(
+            path,
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=_XML_COMPRESSLEVEL,
+            strict_timestamps=False,
+        )
+
+    def __enter__(self) -> _MediaStoredZipWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._zipf.close()
+
+    def write(self, pack_uri, blob: bytes) -> None:
+        name = pack_uri.membername
+        if name.startswith("ppt/media/") and name.lower().endswith(_STORED_MEDIA_SUFFIXES):
+            self._zipf.writestr(name, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zipf.writestr(name, blob)
+
+
+if _PackageWriter is not None:
+
+    class _FastPackageWriter(_PackageWriter):
+        """python-pptx's package serializer with _MediaStoredZipWriter as sink."""
+
+        def _write(self) -> None:
+            with _MediaStoredZipWriter(self._pkg_file) as phys_writer:
+                self._write_content_types_stream(phys_writer)
+                self._write_pkg_rels(phys_writer)
+                self._write_parts(phys_writer)
+
+
+def _save_presentation(prs: Presentation, path: str) -> None:
+    """
+    Save prs to path without re-deflating embedded PNG/JPEG media.
+
+    The fast writer relies on python-pptx internals; if a release changes
+    them, the partial file is removed and the public prs.save() is used.
+    """
+    if _PackageWriter is None:
+        prs.save(path)
+        return
+    try:
+        package = prs.part.package
+        _FastPackageWriter.write(path, package._rels, tuple(package.iter_parts()))
+    except (AttributeError, TypeError):
+        Path(path).unlink(missing_ok=True)
+        prs.save(path)
+
+
+def _image_urls(slides: list[SlideWithImage]) -> list[str]:
+    """Unique image URLs of the deck, in slide order."""
+    return list(dict.fromkeys(s.image_url for s in slides if s.image_url))
+
+
+async def _download_async(client: httpx.AsyncClient, url: str) -> bytes:
+    """Async counterpart of _download (64 KB streamed chunks)."""
+    buf = io.BytesIO()
+    async with client.stream("GET", url, timeout=10.0) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+            buf.write(chunk)
+    return buf.getvalue()
+
+
+def _fit_centered(
+    img_w: float,
+    img_h: float,
+    left: float,
+    top: float,
+    box_w: float,
+    box_h: float,
+) -> Tuple[int, int, int, int]:
+    """EMU (left, top, width, height) of an img_w x img_h image fitted and centered in a box."""
+    scale = min(box_w / img_w, box_h / img_h)
+    fit_w = img_w * scale
+    fit_h = img_h * scale
+    return (
+        _emu(left + (box_w - fit_w) / 2.0),
+        _emu(top + (box_h - fit_h) / 2.0),
+        _emu(fit_w),
+        _emu(fit_h),
+    )
+
+
+def _download(client: httpx.Client, url: str) -> bytes:
+    """GET url in 64 KB chunks (no second full-size copy of large images)."""
+    buf = io.BytesIO()
+    with client.stream("GET", url) as response:
+        response.raise_for_status()
+        for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+            buf.write(chunk)
+    return buf.getvalue()
+
+
 class PPTExporter:
     """Exports presentation with theme-based styling."""
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: Optional[httpx.Client] = None) -> None:
         self._theme = None
+        # Long-lived pooled client reused by every image download (keep-alive,
+        # HTTP/2 when available): injected or owned by this exporter
+        self._owns_http = http_client is None
+        self._http = http_client or create_client(timeout=10.0)
+        # Image bytes and (width_inch, height_inch) for the deck being rendered,
+        # keyed by URL: a URL reused across slides is downloaded/parsed once
+        self._image_cache: dict[str, bytes] = {}
+        self._image_sizes: dict[str, Optional[Tuple[float, float]]] = {}
+        # LayoutType -> handler; anything unlisted renders as title + bullets
+        self._layout_handlers: dict[LayoutType, Callable[..., int]] = {
+            LayoutType.BOLD_SECTION_DIVIDER: self._layout_bold_section,
+            LayoutType.HERO_BACKGROUND: self._layout_hero_background,
+            LayoutType.HERO_RIGHT: self._render_hero_right,
+            LayoutType.CARD_LAYOUT: self._layout_card,
+            LayoutType.ACCENT_LEFT_LAYOUT: self._layout_accent_left,
+            LayoutType.CONCLUSION: self._layout_accent_left,
+            LayoutType.MINIMAL_TEXT: self._layout_minimal_text,
+            LayoutType.IMAGE_FOCUS: self._render_image_focus,
+            LayoutType.TWO_COLUMN: self._render_two_column,
+        }
 
     def _add_picture_fit_centered(
         self,
         slide,
-        img_stream: io.BytesIO,
+        image: bytes,
         left_inch: float,
         top_inch: float,
         box_width_inch: float,
         box_height_inch: float,
+        cache_key: Optional[str] = None,
     ) -> bool:
         """
         Add image to slide preserving aspect ratio, fitted inside box and centered.
         Never stretches. Returns True if added, False on error.
+        cache_key (the image URL) memoizes the size lookup across slides.
         """
-        size = _get_image_size_inches(img_stream)
+        size = self._image_size_inches(image, cache_key)
         if not size:
             return False
         img_w, img_h = size
         if img_w <= 0 or img_h <= 0:
             return False
-        scale = min(box_width_inch / img_w, box_height_inch / img_h)
-        fit_w = img_w * scale
-        fit_h = img_h * scale
-        left_cen = left_inch + (box_width_inch - fit_w) / 2.0
-        top_cen = top_inch + (box_height_inch - fit_h) / 2.0
         try:
-            img_stream.seek(0)
             slide.shapes.add_picture(
-                img_stream,
-                Inches(left_cen),
-                Inches(top_cen),
-                width=Inches(fit_w),
-                height=Inches(fit_h),
+                io.BytesIO(image),
+                *_fit_centered(img_w, img_h, left_inch, top_inch, box_width_inch, box_height_inch),
             )
             return True
         except Exception:
             return False
 
-    def _apply_slide_background(self, slide) -> None:
-        fill = slide.background.fill
+    def _add_picture_full_slide(self, slide, image: bytes) -> bool:
+        """
+        Hero fast path: fit image to the whole slide, centered, without our own
+        size lookup. add_picture parses the image anyway; its pixel size is reused.
+        """
+        try:
+            pic = slide.shapes.add_picture(io.BytesIO(image), 0, 0)
+        except Exception:
+            return False
+        w_px, h_px = pic.image.size
+        if w_px <= 0 or h_px <= 0:
+            pic._element.getparent().remove(pic._element)
+            return False
+        pic.left, pic.top, pic.width, pic.height = _fit_centered(
+            w_px / _IMG_DPI, h_px / _IMG_DPI, 0, 0, SLIDE_WIDTH_INCH, SLIDE_HEIGHT_INCH
+        )
+        return True
+
+    def _bind_theme(self) -> None:
+        """Build the theme's colors and font sizes once per export, not per paragraph."""
+        theme = self._theme
+        self._c_background = RGBColor(*theme.background)
+        self._c_primary = RGBColor(*theme.primary)
+        self._c_secondary = RGBColor(*theme.secondary)
+        self._c_accent = RGBColor(*theme.accent)
+        self._c_card_bg = RGBColor(*theme.card_bg)
+        self._c_overlay = RGBColor(*theme.overlay_dark)
+        self._c_section_bg = RGBColor(*theme.section_bg)
+        self._c_section_text = RGBColor(*theme.section_text)
+        self._c_gradient = (
+            (RGBColor(*theme.gradient_start), RGBColor(*theme.gradient_end))
+            if theme.use_gradient and theme.gradient_start and theme.gradient_end
+            else None
+        )
+        self._pt_title = Pt(theme.title_size)
+        self._pt_body = Pt(theme.body_size)
+        self._pt_body_small = Pt(max(BODY_MIN_FONT_SIZE, theme.body_size - 2))
+        self._pt_caption = Pt(theme.caption_size)
+        self._bullet_styles: dict[tuple, object] = {}
+
+    def _image_size_inches(
+        self, image: bytes, cache_key: Optional[str] = None
+    ) -> Optional[Tuple[float, float]]:
+        if cache_key is None:
+            return _get_image_size_inches(image)
+        if cache_key not in self._image_sizes:
+            self._image_sizes[cache_key] = _get_image_size_inches(image)
+        return self._image_sizes[cache_key]
+
+    def _apply_master_background(self, prs: Presentation) -> None:
+        """Theme background set once on the slide master; slides inherit it."""
+        fill = prs.slide_master.background.fill
         fill.solid()
-        fill.fore_color.rgb = RGBColor(*self._theme.background)
+        fill.fore_color.rgb = self._c_background
 
     def _apply_accent_background(self, slide) -> None:
         fill = slide.background.fill
-        if (
-            self._theme.use_gradient
-            and self._theme.gradient_start
-            and self._theme.gradient_end
-        ):
+        if self._c_gradient is not None:
             try:
                 fill.gradient()
                 fill.gradient_angle = 135
                 stops = fill.gradient_stops
                 if len(stops) >= 1:
-                    stops[0].color.rgb = RGBColor(*self._theme.gradient_start)
+                    stops[0].color.rgb = self._c_gradient[0]
                     stops[0].position = 0
                 if len(stops) >= 2:
-                    stops[1].color.rgb = RGBColor(*self._theme.gradient_end)
+                    stops[1].color.rgb = self._c_gradient[1]
                     stops[1].position = 1
             except Exception:
                 fill.solid()
-                fill.fore_color.rgb = RGBColor(*self._theme.section_bg)
+                fill.fore_color.rgb = self._c_section_bg
         else:
             fill.solid()
-            fill.fore_color.rgb = RGBColor(*self._theme.section_bg)
+            fill.fore_color.rgb = self._c_section_bg
 
     def _add_accent_bar_left(self, slide) -> None:
         bar = slide.shapes.add_shape(
             MSO_SHAPE.RECTANGLE,
             0, 0,
-            Inches(ACCENT_BAR_WIDTH),
+            _ACCENT_BAR_WIDTH_EMU,
             SLIDE_HEIGHT,
         )
         bar.fill.solid()
-        bar.fill.fore_color.rgb = RGBColor(*self._theme.accent)
+        bar.fill.fore_color.rgb = self._c_accent
         bar.line.fill.background()
 
     def _add_accent_line_top(self, slide) -> None:
@@ -146,10 +383,10 @@ class PPTExporter:
             MSO_SHAPE.RECTANGLE,
             0, 0,
             SLIDE_WIDTH,
-            Inches(ACCENT_LINE_HEIGHT),
+            _ACCENT_LINE_HEIGHT_EMU,
         )
         line.fill.solid()
-        line.fill.fore_color.rgb = RGBColor(*self._theme.accent)
+        line.fill.fore_color.rgb = self._c_accent
         line.line.fill.background()
 
     def _add_overlay(self, slide, alpha: float = 0.6) -> None:
@@ -160,43 +397,43 @@ class PPTExporter:
             SLIDE_HEIGHT,
         )
         overlay.fill.solid()
-        overlay.fill.fore_color.rgb = RGBColor(*self._theme.overlay_dark)
+        overlay.fill.fore_color.rgb = self._c_overlay
         overlay.fill.transparency = alpha
         overlay.line.fill.background()
 
     def _add_card_panel(self, slide, left: float, top: float, width: float, height: float) -> None:
         card = slide.shapes.add_shape(
             MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(left), Inches(top),
-            Inches(width), Inches(height),
+            _emu(left), _emu(top),
+            _emu(width), _emu(height),
         )
         card.fill.solid()
-        card.fill.fore_color.rgb = RGBColor(*self._theme.card_bg)
+        card.fill.fore_color.rgb = self._c_card_bg
         card.line.fill.background()
         if hasattr(card, "adjustments") and card.adjustments:
             card.adjustments[0] = 0.05
 
     def _apply_title_style(self, paragraph, size: Optional[int] = None) -> None:
-        paragraph.font.size = Pt(size or self._theme.title_size)
+        paragraph.font.size = Pt(size) if size else self._pt_title
         paragraph.font.bold = True
         paragraph.font.name = self._theme.font_family
-        paragraph.font.color.rgb = RGBColor(*self._theme.primary)
+        paragraph.font.color.rgb = self._c_primary
 
     def _apply_body_style(self, paragraph) -> None:
-        paragraph.font.size = Pt(self._theme.body_size)
+        paragraph.font.size = self._pt_body
         paragraph.font.name = self._theme.font_family
-        paragraph.font.color.rgb = RGBColor(*self._theme.primary)
-        paragraph.space_after = Pt(12)
+        paragraph.font.color.rgb = self._c_primary
+        paragraph.space_after = _PT_12
         paragraph.line_spacing = LINE_SPACING
 
     def _apply_caption_style(self, paragraph) -> None:
-        paragraph.font.size = Pt(self._theme.caption_size)
+        paragraph.font.size = self._pt_caption
         paragraph.font.name = self._theme.font_family
-        paragraph.font.color.rgb = RGBColor(*self._theme.secondary)
+        paragraph.font.color.rgb = self._c_secondary
 
     def _apply_section_text(self, paragraph) -> None:
         paragraph.font.name = self._theme.font_family
-        paragraph.font.color.rgb = RGBColor(*self._theme.section_text)
+        paragraph.font.color.rgb = self._c_section_text
 
     def _prepare_title(self, title: str, max_chars: int = 120) -> str:
         """Keep title in safe zone; truncate with ellipsis if too long."""
@@ -222,17 +459,49 @@ class PPTExporter:
             font_override = max(BODY_MIN_FONT_SIZE, body_size - 2)
         return bullets, font_override
 
+    def _bullet_style(
+        self, section: bool = False, small: bool = False, centered: bool = False
+    ):
+        """
+        Paragraph properties (<a:pPr>) for one bullet style, built once per export
+        with the regular style helpers and then copied onto each bullet.
+        """
+        key = (section, small, centered)
+        style = self._bullet_styles.get(key)
+        if style is None:
+            p = _Paragraph(parse_xml(f"<a:p {nsdecls('a')}/>"), None)
+            if centered:
+                p.alignment = 1
+            if section:
+                p.font.size = self._pt_body_small if small else self._pt_body
+                p.font.name = self._theme.font_family
+                self._apply_section_text(p)
+                p.space_after = _PT_8
+            else:
+                self._apply_body_style(p)
+                if small:
+                    p.font.size = self._pt_body_small
+                    p.space_after = _PT_4
+            style = self._bullet_styles[key] = p._p.get_or_add_pPr()
+        return style
+
+    def _write_bullets(self, tf, bullets: list[str], style) -> None:
+        """Write one "•" paragraph per bullet, each taking a copy of style."""
+        for i, point in enumerate(bullets):
+            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+            p.text = f"•  {point}"
+            p._p.insert(0, copy.deepcopy(style))
+
     def _add_title_slide(self, prs: Presentation, title: str, subtitle: str = "") -> None:
         template = get_template(LayoutType.TITLE_SLIDE)
         slide = prs.slides.add_slide(prs.slide_layouts[6])
-        self._apply_slide_background(slide)
 
         if template.accent_top:
             self._add_accent_line_top(slide)
 
         if template.title_area:
             l, t, w, h = template.title_area.inches
-            box = slide.shapes.add_textbox(l, t, w, min(h, Inches(TITLE_AREA_MAX_HEIGHT)))
+            box = slide.shapes.add_textbox(l, t, w, min(h, _TITLE_AREA_MAX_HEIGHT_EMU))
             tf = box.text_frame
             tf.word_wrap = True
             p = tf.paragraphs[0]
@@ -260,36 +529,8 @@ class PPTExporter:
         template = get_template(layout)
         slide = prs.slides.add_slide(prs.slide_layouts[6])
 
-        images_added = 0
-
-        if layout == LayoutType.BOLD_SECTION_DIVIDER:
-            self._apply_accent_background(slide)
-            self._render_bold_section(slide, template, slide_data)
-        elif layout == LayoutType.HERO_BACKGROUND and slide_data.image_url:
-            images_added = self._render_hero_background(slide, template, slide_data)
-        elif layout == LayoutType.HERO_RIGHT:
-            images_added = self._render_hero_right(slide, template, slide_data)
-        elif layout == LayoutType.CARD_LAYOUT:
-            self._apply_slide_background(slide)
-            self._render_card_layout(slide, template, slide_data)
-        elif layout == LayoutType.ACCENT_LEFT_LAYOUT or layout == LayoutType.CONCLUSION:
-            self._apply_slide_background(slide)
-            self._add_accent_bar_left(slide)
-            self._render_title_and_bullets(slide, template, slide_data)
-        elif layout == LayoutType.MINIMAL_TEXT:
-            self._apply_slide_background(slide)
-            self._render_minimal_text(slide, template, slide_data)
-        elif layout == LayoutType.IMAGE_FOCUS:
-            self._apply_slide_background(slide)
-            images_added = self._render_image_focus(slide, template, slide_data)
-        elif layout == LayoutType.TWO_COLUMN:
-            self._apply_slide_background(slide)
-            images_added = self._render_two_column(slide, template, slide_data)
-        else:
-            self._apply_slide_background(slide)
-            if template.accent_left:
-                self._add_accent_bar_left(slide)
-            self._render_title_and_bullets(slide, template, slide_data)
+        handler = self._layout_handlers.get(layout, self._layout_default)
+        images_added = handler(slide, template, slide_data)
 
         if slide_data.speaker_notes:
             notes_slide = slide.notes_slide
@@ -297,13 +538,45 @@ class PPTExporter:
 
         return images_added
 
+    # Layout handlers: decoration + renderer per LayoutType; return images added.
+    # The theme background comes from the slide master (see export).
+
+    def _layout_default(self, slide, template, slide_data: SlideWithImage) -> int:
+        if template.accent_left:
+            self._add_accent_bar_left(slide)
+        self._render_title_and_bullets(slide, template, slide_data)
+        return 0
+
+    def _layout_bold_section(self, slide, template, slide_data: SlideWithImage) -> int:
+        self._apply_accent_background(slide)
+        self._render_bold_section(slide, template, slide_data)
+        return 0
+
+    def _layout_hero_background(self, slide, template, slide_data: SlideWithImage) -> int:
+        if not slide_data.image_url:
+            return self._layout_default(slide, template, slide_data)
+        return self._render_hero_background(slide, template, slide_data)
+
+    def _layout_card(self, slide, template, slide_data: SlideWithImage) -> int:
+        self._render_card_layout(slide, template, slide_data)
+        return 0
+
+    def _layout_accent_left(self, slide, template, slide_data: SlideWithImage) -> int:
+        self._add_accent_bar_left(slide)
+        self._render_title_and_bullets(slide, template, slide_data)
+        return 0
+
+    def _layout_minimal_text(self, slide, template, slide_data: SlideWithImage) -> int:
+        self._render_minimal_text(slide, template, slide_data)
+        return 0
+
     def _render_bold_section(
         self, slide, template, slide_data: SlideWithImage
     ) -> None:
         """BOLD_SECTION_DIVIDER — large centered title, accent bg."""
         if template.title_area:
             l, t, w, h = template.title_area.inches
-            box = slide.shapes.add_textbox(l, t, w, min(h, Inches(TITLE_AREA_MAX_HEIGHT)))
+            box = slide.shapes.add_textbox(l, t, w, min(h, _TITLE_AREA_MAX_HEIGHT_EMU))
             tf = box.text_frame
             tf.word_wrap = True
             p = tf.paragraphs[0]
@@ -323,7 +596,7 @@ class PPTExporter:
             p = tf.paragraphs[0]
             p.text = bullets[0]
             p.alignment = 1
-            p.font.size = Pt(self._theme.body_size)
+            p.font.size = self._pt_body
             p.font.name = self._theme.font_family
             self._apply_section_text(p)
 
@@ -332,23 +605,19 @@ class PPTExporter:
     ) -> int:
         """HERO_BACKGROUND — full image (aspect ratio preserved), overlay, text on top."""
         try:
-            img_stream = self._fetch_image(slide_data.image_url)
-            if img_stream and not self._add_picture_fit_centered(
-                slide, img_stream, 0, 0, SLIDE_WIDTH_INCH, SLIDE_HEIGHT_INCH
-            ):
-                img_stream = None
-            if not img_stream:
-                self._apply_slide_background(slide)
+            image = self._fetch_image(slide_data.image_url)
+            if image and not self._add_picture_full_slide(slide, image):
+                image = None
+            if not image:
                 return 0
         except Exception:
-            self._apply_slide_background(slide)
             return 0
 
         self._add_overlay(slide, alpha=0.55)
 
         if template.title_area:
             l, t, w, h = template.title_area.inches
-            box = slide.shapes.add_textbox(l, t, w, min(h, Inches(TITLE_AREA_MAX_HEIGHT)))
+            box = slide.shapes.add_textbox(l, t, w, min(h, _TITLE_AREA_MAX_HEIGHT_EMU))
             tf = box.text_frame
             tf.word_wrap = True
             p = tf.paragraphs[0]
@@ -365,17 +634,9 @@ class PPTExporter:
             box = slide.shapes.add_textbox(l, t, w, h)
             tf = box.text_frame
             tf.word_wrap = True
-            sz = body_font or self._theme.body_size
-            for i, point in enumerate(bullets[:3]):
-                if i == 0:
-                    p = tf.paragraphs[0]
-                else:
-                    p = tf.add_paragraph()
-                p.text = f"•  {point}"
-                p.font.size = Pt(sz)
-                p.font.name = self._theme.font_family
-                self._apply_section_text(p)
-                p.space_after = Pt(8)
+            self._write_bullets(
+                tf, bullets[:3], self._bullet_style(section=True, small=bool(body_font))
+            )
 
         return 1
 
@@ -384,11 +645,10 @@ class PPTExporter:
     ) -> int:
         """HERO_RIGHT — text left, full-height image right."""
         images_added = 0
-        self._apply_slide_background(slide)
 
         if template.title_area:
             l, t, w, h = template.title_area.inches
-            box = slide.shapes.add_textbox(l, t, w, min(h, Inches(TITLE_AREA_MAX_HEIGHT)))
+            box = slide.shapes.add_textbox(l, t, w, min(h, _TITLE_AREA_MAX_HEIGHT_EMU))
             tf = box.text_frame
             tf.word_wrap = True
             p = tf.paragraphs[0]
@@ -401,24 +661,16 @@ class PPTExporter:
             box = slide.shapes.add_textbox(l, t, w, h)
             tf = box.text_frame
             tf.word_wrap = True
-            for i, point in enumerate(bullets):
-                if i == 0:
-                    p = tf.paragraphs[0]
-                else:
-                    p = tf.add_paragraph()
-                p.text = f"•  {point}"
-                self._apply_body_style(p)
-                if body_font:
-                    p.font.size = Pt(body_font)
-                    p.space_after = Pt(4)
+            self._write_bullets(tf, bullets, self._bullet_style(small=bool(body_font)))
 
         if template.image_area and slide_data.image_url:
             try:
-                img_stream = self._fetch_image(slide_data.image_url)
-                if img_stream:
+                image = self._fetch_image(slide_data.image_url)
+                if image:
                     b = template.image_area
                     if self._add_picture_fit_centered(
-                        slide, img_stream, b.left, b.top, b.width, b.height
+                        slide, image, b.left, b.top, b.width, b.height,
+                        cache_key=slide_data.image_url,
                     ):
                         images_added = 1
             except Exception:
@@ -436,7 +688,7 @@ class PPTExporter:
 
         if template.title_area:
             l, t, w, h = template.title_area.inches
-            box = slide.shapes.add_textbox(l, t, w, min(h, Inches(TITLE_AREA_MAX_HEIGHT)))
+            box = slide.shapes.add_textbox(l, t, w, min(h, _TITLE_AREA_MAX_HEIGHT_EMU))
             tf = box.text_frame
             tf.word_wrap = True
             p = tf.paragraphs[0]
@@ -449,16 +701,7 @@ class PPTExporter:
             box = slide.shapes.add_textbox(l, t, w, h)
             tf = box.text_frame
             tf.word_wrap = True
-            for i, point in enumerate(bullets):
-                if i == 0:
-                    p = tf.paragraphs[0]
-                else:
-                    p = tf.add_paragraph()
-                p.text = f"•  {point}"
-                self._apply_body_style(p)
-                if body_font:
-                    p.font.size = Pt(body_font)
-                    p.space_after = Pt(4)
+            self._write_bullets(tf, bullets, self._bullet_style(small=bool(body_font)))
 
     def _render_minimal_text(
         self, slide, template, slide_data: SlideWithImage
@@ -466,7 +709,7 @@ class PPTExporter:
         """MINIMAL_TEXT — very large title, minimal body."""
         if template.title_area:
             l, t, w, h = template.title_area.inches
-            box = slide.shapes.add_textbox(l, t, w, min(h, Inches(TITLE_AREA_MAX_HEIGHT)))
+            box = slide.shapes.add_textbox(l, t, w, min(h, _TITLE_AREA_MAX_HEIGHT_EMU))
             tf = box.text_frame
             tf.word_wrap = True
             p = tf.paragraphs[0]
@@ -480,21 +723,14 @@ class PPTExporter:
             box = slide.shapes.add_textbox(l, t, w, h)
             tf = box.text_frame
             tf.word_wrap = True
-            for i, point in enumerate(bullets):
-                if i == 0:
-                    p = tf.paragraphs[0]
-                else:
-                    p = tf.add_paragraph()
-                p.text = f"•  {point}"
-                p.alignment = 1
-                self._apply_body_style(p)
+            self._write_bullets(tf, bullets, self._bullet_style(centered=True))
 
     def _render_title_and_bullets(
         self, slide, template, slide_data: SlideWithImage
     ) -> None:
         if template.title_area:
             l, t, w, h = template.title_area.inches
-            box = slide.shapes.add_textbox(l, t, w, min(h, Inches(TITLE_AREA_MAX_HEIGHT)))
+            box = slide.shapes.add_textbox(l, t, w, min(h, _TITLE_AREA_MAX_HEIGHT_EMU))
             tf = box.text_frame
             tf.word_wrap = True
             p = tf.paragraphs[0]
@@ -507,16 +743,7 @@ class PPTExporter:
             box = slide.shapes.add_textbox(l, t, w, h)
             tf = box.text_frame
             tf.word_wrap = True
-            for i, point in enumerate(bullets):
-                if i == 0:
-                    p = tf.paragraphs[0]
-                else:
-                    p = tf.add_paragraph()
-                p.text = f"•  {point}"
-                self._apply_body_style(p)
-                if body_font:
-                    p.font.size = Pt(body_font)
-                    p.space_after = Pt(4)
+            self._write_bullets(tf, bullets, self._bullet_style(small=bool(body_font)))
 
     def _render_two_column(
         self, slide, template, slide_data: SlideWithImage
@@ -524,7 +751,7 @@ class PPTExporter:
         images_added = 0
         if template.title_area:
             l, t, w, h = template.title_area.inches
-            box = slide.shapes.add_textbox(l, t, w, min(h, Inches(TITLE_AREA_MAX_HEIGHT)))
+            box = slide.shapes.add_textbox(l, t, w, min(h, _TITLE_AREA_MAX_HEIGHT_EMU))
             tf = box.text_frame
             tf.word_wrap = True
             p = tf.paragraphs[0]
@@ -537,24 +764,16 @@ class PPTExporter:
             box = slide.shapes.add_textbox(l, t, w, h)
             tf = box.text_frame
             tf.word_wrap = True
-            for i, point in enumerate(bullets):
-                if i == 0:
-                    p = tf.paragraphs[0]
-                else:
-                    p = tf.add_paragraph()
-                p.text = f"•  {point}"
-                self._apply_body_style(p)
-                if body_font:
-                    p.font.size = Pt(body_font)
-                    p.space_after = Pt(4)
+            self._write_bullets(tf, bullets, self._bullet_style(small=bool(body_font)))
 
         if template.image_area and slide_data.image_url:
             try:
-                img_stream = self._fetch_image(slide_data.image_url)
-                if img_stream:
+                image = self._fetch_image(slide_data.image_url)
+                if image:
                     b = template.image_area
                     if self._add_picture_fit_centered(
-                        slide, img_stream, b.left, b.top, b.width, b.height
+                        slide, image, b.left, b.top, b.width, b.height,
+                        cache_key=slide_data.image_url,
                     ):
                         images_added = 1
             except Exception:
@@ -567,11 +786,12 @@ class PPTExporter:
         images_added = 0
         if template.image_area and slide_data.image_url:
             try:
-                img_stream = self._fetch_image(slide_data.image_url)
-                if img_stream:
+                image = self._fetch_image(slide_data.image_url)
+                if image:
                     b = template.image_area
                     if self._add_picture_fit_centered(
-                        slide, img_stream, b.left, b.top, b.width, b.height
+                        slide, image, b.left, b.top, b.width, b.height,
+                        cache_key=slide_data.image_url,
                     ):
                         images_added = 1
             except Exception:
@@ -590,11 +810,51 @@ class PPTExporter:
             self._apply_caption_style(p)
         return images_added
 
-    def _fetch_image(self, url: str) -> Optional[io.BytesIO]:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            return io.BytesIO(response.content)
+    def _prefetch_images(self, slides: list[SlideWithImage]) -> dict[str, bytes]:
+        """Download all slide images concurrently; failed URLs are left out."""
+        urls = _image_urls(slides)
+        if not urls:
+            return {}
+
+        def download(url: str) -> Optional[bytes]:
+            try:
+                return _download(self._http, url)
+            except Exception:
+                # One bad URL (HTTP, invalid URL, I/O) must not fail the deck
+                return None
+
+        workers = min(_PREFETCH_WORKERS, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(download, urls))
+        return {url: data for url, data in zip(urls, results) if data is not None}
+
+    async def _prefetch_images_async(
+        self, slides: list[SlideWithImage], client: httpx.AsyncClient
+    ) -> dict[str, bytes]:
+        """Download all slide images concurrently on the event loop; failed URLs are left out."""
+        urls = _image_urls(slides)
+
+        async def download(url: str) -> Optional[bytes]:
+            try:
+                return await _download_async(client, url)
+            except Exception:
+                # One bad URL (HTTP, invalid URL, I/O) must not fail the deck
+                return None
+
+        results = await asyncio.gather(*(download(url) for url in urls))
+        return {url: data for url, data in zip(urls, results) if data is not None}
+
+    def _fetch_image(self, url: str) -> Optional[bytes]:
+        """Image bytes for url (prefetched, else downloaded now); consumers wrap as needed."""
+        data = self._image_cache.get(url)
+        if data is None:
+            data = self._image_cache[url] = _download(self._http, url)
+        return data
+
+    def close(self) -> None:
+        """Close the HTTP client if this exporter created it."""
+        if self._owns_http:
+            self._http.close()
 
     def export(
         self,
@@ -602,15 +862,42 @@ class PPTExporter:
         title: str,
         output_path: Optional[Path | str] = None,
         theme: Optional[str] = None,
+        prefetched_images: Optional[dict[str, bytes]] = None,
+    ) -> ExportResult:
+        """
+        Render and save the deck. prefetched_images (URL -> bytes) skips the
+        up-front download; URLs missing from it are still fetched.
+
+        Safe to call concurrently: the deck is rendered by a fresh exporter
+        that shares only this one's HTTP client, so per-deck state (theme,
+        colors, bullet styles, image caches) is never shared between exports.
+        """
+        renderer = PPTExporter(http_client=self._http)
+        return renderer._export_deck(slides, title, output_path, theme, prefetched_images)
+
+    def _export_deck(
+        self,
+        slides: list[SlideWithImage],
+        title: str,
+        output_path: Optional[Path | str],
+        theme: Optional[str],
+        prefetched_images: Optional[dict[str, bytes]],
     ) -> ExportResult:
         self._theme = get_theme(theme)
+        self._bind_theme()
 
         prs = Presentation()
         prs.slide_width = SLIDE_WIDTH
         prs.slide_height = SLIDE_HEIGHT
+        self._apply_master_background(prs)
 
         self._add_title_slide(prs, title)
 
+        # Overlap all image downloads up front instead of one GET per slide
+        if prefetched_images is not None:
+            self._image_cache = dict(prefetched_images)
+        else:
+            self._image_cache = self._prefetch_images(slides)
         images_included = 0
         total = len(slides)
         for i, s in enumerate(slides):
@@ -626,10 +913,34 @@ class PPTExporter:
 
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        prs.save(str(path))
+        _save_presentation(prs, str(path))
 
         return ExportResult(
             output_path=str(path.resolve()),
             slide_count=len(slides) + 1,
             images_included=images_included,
         )
+
+    async def export_async(
+        self,
+        slides: list[SlideWithImage],
+        title: str,
+        output_path: Optional[Path | str] = None,
+        theme: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> ExportResult:
+        """
+        Like export(), for callers on an event loop.
+
+        Images are fetched with asyncio.gather on http_client (e.g. the
+        agent's shared pooled client; a temporary one if None), then rendering
+        and saving run in a worker thread so the loop is never blocked.
+        """
+        if http_client is None:
+            async with create_async_client(timeout=10.0) as client:
+                images = await self._prefetch_images_async(slides, client)
+        else:
+            images = await self._prefetch_images_async(slides, http_client)
+        return await asyncio.to_thread(
+            self.export, slides, title, output_path, theme, prefetched_images=images
+        )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from typing import Optional
 
 # Evidence-based speaking rate: 120–150 WPM typical
@@ -19,6 +21,14 @@ SLIDES_PER_MINUTE_MAX = 2
 WORD_COUNT_TOLERANCE_LOW = 0.9
 WORD_COUNT_TOLERANCE_HIGH = 1.1
 
+# Audience terms selecting a slower / faster speaking rate (one scan each)
+_SLOW_AUDIENCE_RE = re.compile(
+    "student|general|public|beginner|overview|introductory|everyone"
+)
+_FAST_AUDIENCE_RE = re.compile(
+    "expert|technical|engineer|developer|specialist|professional"
+)
+
 
 def get_wpm_for_audience(audience: str) -> int:
     """
@@ -31,30 +41,9 @@ def get_wpm_for_audience(audience: str) -> int:
     if not audience or not audience.strip():
         return DEFAULT_WPM
     lower = audience.lower().strip()
-    if any(
-        term in lower
-        for term in (
-            "student",
-            "general",
-            "public",
-            "beginner",
-            "overview",
-            "introductory",
-            "everyone",
-        )
-    ):
+    if _SLOW_AUDIENCE_RE.search(lower):
         return (WPM_SLOW_MIN + WPM_SLOW_MAX) // 2  # 125
-    if any(
-        term in lower
-        for term in (
-            "expert",
-            "technical",
-            "engineer",
-            "developer",
-            "specialist",
-            "professional",
-        )
-    ):
+    if _FAST_AUDIENCE_RE.search(lower):
         return (WPM_FAST_MIN + WPM_FAST_MAX) // 2  # 145
     return DEFAULT_WPM
 
@@ -68,6 +57,8 @@ def compute_presentation_targets(
     Compute target word count and slide count for the given duration and audience.
 
     Optionally adjust WPM by speaker age (e.g. younger speakers slightly slower).
+    Results are memoized per (duration, audience, speaker age/experience);
+    each call returns its own dict.
 
     Returns:
         {
@@ -77,17 +68,14 @@ def compute_presentation_targets(
             "wpm": int,
         }
     """
-    wpm = get_wpm_for_audience(audience)
+    age: Optional[int] = None
+    experience_level = ""
     if speaker_profile is not None and hasattr(speaker_profile, "age"):
         age = getattr(speaker_profile, "age", 30)
-        if age < 18:
-            wpm = min(wpm, WPM_SLOW_MAX)
-        elif age >= 50 and getattr(speaker_profile, "experience_level", ""):
-            if str(getattr(speaker_profile, "experience_level", "")).lower() == "expert":
-                wpm = max(wpm, WPM_FAST_MIN)
-    target_word_count = duration_minutes * wpm
-    min_slides = max(3, duration_minutes * SLIDES_PER_MINUTE_MIN)
-    max_slides = max(min_slides, duration_minutes * SLIDES_PER_MINUTE_MAX)
+        experience_level = str(getattr(speaker_profile, "experience_level", "") or "")
+    target_word_count, min_slides, max_slides, wpm = _compute_targets(
+        duration_minutes, audience, age, experience_level
+    )
     return {
         "target_word_count": target_word_count,
         "min_slides": min_slides,
@@ -96,16 +84,38 @@ def compute_presentation_targets(
     }
 
 
+@functools.lru_cache(maxsize=256)
+def _compute_targets(
+    duration_minutes: int,
+    audience: str,
+    age: Optional[int],
+    experience_level: str,
+) -> tuple[int, int, int, int]:
+    """(target_word_count, min_slides, max_slides, wpm) from hashable inputs."""
+    wpm = get_wpm_for_audience(audience)
+    if age is not None:
+        if age < 18:
+            wpm = min(wpm, WPM_SLOW_MAX)
+        elif age >= 50 and experience_level:
+            if experience_level.lower() == "expert":
+                wpm = max(wpm, WPM_FAST_MIN)
+    target_word_count = duration_minutes * wpm
+    min_slides = max(3, duration_minutes * SLIDES_PER_MINUTE_MIN)
+    max_slides = max(min_slides, duration_minutes * SLIDES_PER_MINUTE_MAX)
+    return target_word_count, min_slides, max_slides, wpm
+
+
 def word_count(text: str) -> int:
     """Count words in text (whitespace-separated)."""
-    if not text or not text.strip():
-        return 0
-    return len(text.split())
+    # str.split() is one C-level pass and yields [] for blank text
+    return len(text.split()) if text else 0
 
 
 def manuscript_word_count(manuscript) -> int:
-    """Count words in a PresentationManuscript (full_text)."""
-    return word_count(manuscript.full_text())
+    """Count words in a PresentationManuscript (same total as its full_text)."""
+    # Sections are joined by blank lines, so per-section counts add up exactly
+    # without building the joined copy of the whole manuscript
+    return sum(word_count(s.content) for s in manuscript.sections)
 
 
 def is_manuscript_length_acceptable(
@@ -0,0 +1,48 @@
+"""Async token-bucket rate limiter for outgoing API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket allowing max_rate acquisitions per time_period seconds.
+
+    Bursts up to max_rate are admitted immediately; after that callers wait
+    for tokens to refill, so requests are paced instead of hitting 429s.
+    Use as `async with limiter: ...`.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+        self._capacity = max_rate
+        self._refill_per_second = max_rate / time_period
+        self._tokens = max_rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity,
+            self._tokens + (now - self._updated) * self._refill_per_second,
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it (FIFO among waiters)."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
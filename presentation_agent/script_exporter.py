@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Optional
 
 from docx import Document
 from docx.shared import Pt
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 from presentation_agent.models import PresentationManuscript
 
+# Paragraph style for manuscript prose (spacing set once, not per paragraph)
+_MANUSCRIPT_STYLE = "Manuscript"
+# Paragraph break: a blank line, tolerating spaces and \r\n line endings
+_PARA_BREAK_RE = re.compile(r"\s*\n\s*\n\s*")
+
 
 class ScriptExporter:
     """Exports the full speech manuscript to a Word document."""
@@ -65,20 +72,22 @@ class ScriptExporter:
 
         doc.add_paragraph()
 
+        body_style = doc.styles.add_style(_MANUSCRIPT_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+        body_style.base_style = doc.styles["Normal"]
+        body_style.paragraph_format.space_after = Pt(6)
+
         # Full manuscript content: continuous prose
         for section in manuscript.sections:
             # Section heading (optional, for structure)
             if section.name:
                 doc.add_heading(section.name, level=1)
 
-            # Section content as clean paragraphs
-            # Split by double newlines for paragraph breaks
-            paragraphs = [
-                p.strip() for p in section.content.split("\n\n") if p.strip()
-            ]
+            # Section content as clean paragraphs, split at blank lines
+            paragraphs = _PARA_BREAK_RE.split(section.content.strip())
             for para_text in paragraphs:
-                p = doc.add_paragraph(para_text)
-                p.paragraph_format.space_after = Pt(6)
+                if not para_text:
+                    continue
+                doc.add_paragraph(para_text, style=body_style)
 
             doc.add_paragraph()
 
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+from typing import Optional
+
+from presentation_agent.cache import CacheBackend
 from presentation_agent.llm_client import LLMClient
 from presentation_agent.models import (
     PresentationManuscript,
@@ -11,20 +15,75 @@ from presentation_agent.models import (
 )
 from presentation_agent.presentation_targets import compute_presentation_targets
 
+# Fixed instructions come first (system prompt, then the user prompt's
+# requirements and schema) so every call shares the same prompt prefix and
+# the provider's prompt cache can reuse it; per-call values go last.
+_SYSTEM_PROMPT = (
+    "You are an expert presentation writer specializing in spoken manuscripts. "
+    "LAYER 1 — MANUSCRIPT: This is the full speech script for Word export. "
+    "Slides and speaker notes are derived separately. "
+    "Write as if the presenter will read this aloud. "
+    "Full sentences, natural paragraphs, transitions. "
+    "NO bullet-point style. Output valid JSON. "
+    "When adapting to speaker profile: change only language, tone, and complexity—never alter or stereotype factual content."
+)
+
+_PROMPT_TEMPLATE = """
+Create a TRUE SPEECH MANUSCRIPT from the outline below. The presenter will READ THIS ALOUD.
+
+CRITICAL REQUIREMENTS:
+- Write in full sentences and paragraphs
+- Sound natural when spoken aloud
+- Include smooth transitions between sections
+- Tailor language and examples to the audience
+- Maintain consistent, professional tone
+- NO bullet points, NO slide-style phrasing
+- Structure: Introduction, Main Part (with subsections from outline), Conclusion
+
+Output a JSON object with:
+- "title": string (presentation title)
+- "sections": array of objects, each with:
+  - "name": string (e.g. "Introduction", "Main Part", "Conclusion" or section title)
+  - "content": string (full prose paragraph(s) to be read aloud—continuous text, not bullets)
+
+Title: {title}
+Outline sections:
+{sections_str}
+
+Context:
+- Topic: {topic}
+- Audience: {audience}
+- Duration: {duration_minutes} minutes
+- Language: {language}
+
+{speaker_instruction}
+
+LENGTH (guidance):
+- Aim for roughly {target_words} words (based on {wpm} words per minute for this audience); slightly shorter or longer is fine
+- Adjust depth and pacing so a {duration_minutes}-minute presentation feels natural—no padding, no abrupt cuts
+- Distribute content naturally: introduction ~10-15%, main body ~70-80%, conclusion ~10-15%
+"""
+
 
 def _speaker_instruction(user_input: UserInput) -> str:
     """Build prompt block for speaker profile. Style only; content stays accurate."""
     profile = user_input.speaker_profile
     if not profile:
+        return _speaker_instruction_cached(None, "", "")
+    return _speaker_instruction_cached(
+        profile.age, profile.role or "", profile.experience_level or ""
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _speaker_instruction_cached(age: Optional[int], role: str, experience: str) -> str:
+    """Speaker block for one profile (age None: no profile), built once per profile."""
+    if age is None:
         return (
             "SPEAKER: No specific profile; use a neutral adult tone, "
             "clear and professional."
         )
 
-    age = profile.age
-    role = profile.role or ""
-    experience = profile.experience_level or ""
-
     if age < 18:
         style = (
             "Use simpler sentences and everyday vocabulary. "
@@ -68,9 +127,16 @@ class ScriptGeneratorError(Exception):
 class ScriptGenerator:
     """Expands an outline into a true speech manuscript for reading aloud."""
 
-    def __init__(self, llm_client: LLMClient, model: str | None = None) -> None:
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        model: str | None = None,
+        cache: Optional[CacheBackend] = None,
+    ) -> None:
         self._llm = llm_client
         self._model = model
+        # Identical prompts reuse the previous manuscript (None: always regenerate)
+        self._cache = cache
 
     async def generate(
         self,
@@ -90,71 +156,31 @@ class ScriptGenerator:
         Raises:
             ScriptGeneratorError: On generation failure.
         """
-        system_prompt = (
-            "You are an expert presentation writer specializing in spoken manuscripts. "
-            "LAYER 1 — MANUSCRIPT: This is the full speech script for Word export. "
-            "Slides and speaker notes are derived separately. "
-            "Write as if the presenter will read this aloud. "
-            "Full sentences, natural paragraphs, transitions. "
-            "NO bullet-point style. Output valid JSON. "
-            "When adapting to speaker profile: change only language, tone, and complexity—never alter or stereotype factual content."
-        )
-
-        sections_str = "\n".join(
-            f"- {s.title}: {', '.join(s.key_points)}"
-            for s in outline.sections
-        )
-
         targets = compute_presentation_targets(
             user_input.duration_minutes,
             user_input.audience,
             user_input.speaker_profile,
         )
-        target_words = targets["target_word_count"]
-        wpm = targets["wpm"]
-
-        prompt = f"""
-Create a TRUE SPEECH MANUSCRIPT from this outline. The presenter will READ THIS ALOUD.
-
-Title: {outline.title}
-Outline sections:
-{sections_str}
-
-Context:
-- Topic: {user_input.topic}
-- Audience: {user_input.audience}
-- Duration: {user_input.duration_minutes} minutes
-- Language: {user_input.language}
-
-{_speaker_instruction(user_input)}
-
-LENGTH (guidance):
-- Aim for roughly {target_words} words (based on {wpm} words per minute for this audience); slightly shorter or longer is fine
-- Adjust depth and pacing so a {user_input.duration_minutes}-minute presentation feels natural—no padding, no abrupt cuts
-- Distribute content naturally: introduction ~10-15%, main body ~70-80%, conclusion ~10-15%
 
-CRITICAL REQUIREMENTS:
-- Write in full sentences and paragraphs
-- Sound natural when spoken aloud
-- Include smooth transitions between sections
-- Tailor language and examples to the audience
-- Maintain consistent, professional tone
-- NO bullet points, NO slide-style phrasing
-- Structure: Introduction, Main Part (with subsections from outline), Conclusion
-
-Output a JSON object with:
-- "title": string (presentation title)
-- "sections": array of objects, each with:
-  - "name": string (e.g. "Introduction", "Main Part", "Conclusion" or section title)
-  - "content": string (full prose paragraph(s) to be read aloud—continuous text, not bullets)
-"""
+        prompt = _PROMPT_TEMPLATE.format(
+            title=outline.title,
+            sections_str=outline.sections_as_prompt_block(),
+            topic=user_input.topic,
+            audience=user_input.audience,
+            duration_minutes=user_input.duration_minutes,
+            language=user_input.language,
+            speaker_instruction=_speaker_instruction(user_input),
+            target_words=targets["target_word_count"],
+            wpm=targets["wpm"],
+        )
 
         try:
             return await self._llm.generate_structured(
                 prompt=prompt,
                 response_model=PresentationManuscript,
-                system_prompt=system_prompt,
+                system_prompt=_SYSTEM_PROMPT,
                 model=self._model,
+                cache=self._cache,
             )
         except ValueError as e:
             raise ScriptGeneratorError(f"Script generation failed: {e}") from e
@@ -2,20 +2,163 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import asyncio
+import io
+import re
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
+from presentation_agent.cache import CacheBackend
 from presentation_agent.llm_client import LLMClient
-from presentation_agent.models import PresentationManuscript
+from presentation_agent.models import PresentationManuscript, SpeakerProfile
+from presentation_agent.presentation_targets import (
+    compute_presentation_targets,
+    is_manuscript_length_acceptable,
+)
+
+T = TypeVar("T")
+
+# Opt-in heuristic pre-filter: manuscripts with at least introduction, body
+# and conclusion, full sentences in every section and a length within ±20%
+# of the target are accepted without an LLM evaluation (score None).
+_HEURISTIC_MIN_SECTIONS = 3
+_HEURISTIC_TOLERANCE_LOW = 0.8
+_HEURISTIC_TOLERANCE_HIGH = 1.2
+_SENTENCE_END_RE = re.compile(r"[.!?…]")
+
+# Characters of each section quoted back to the rewrite model
+_PREVIEW_CHARS = 150
+
+# Fixed instructions first, per-call values (context, manuscript) last, so
+# repeated reviews share a prompt prefix the provider can cache.
+_EVALUATE_SYSTEM_PROMPT = (
+    "You are an expert presentation reviewer. "
+    "Evaluate this as a SPOKEN MANUSCRIPT—text to be read aloud. "
+    "Output valid JSON only."
+)
+
+_EVALUATE_PROMPT_TEMPLATE = """
+Evaluate the presentation manuscript below (speech script to be read aloud).
 
+Evaluate on:
+- Structure and logical flow (does it read naturally?)
+- Clarity and understandability when spoken
+- Audience appropriateness
+- Depth of explanation
+- Engagement / rhetorical quality
+- Fit to time duration
+- Natural transitions between sections
+- Avoidance of robotic or outline-like phrasing
 
-class ScriptReviewEvaluation(BaseModel):
-    """Structured evaluation result from the LLM."""
+Output a JSON object with:
+- "score": int (0-10, 10 = excellent spoken manuscript)
+- "strengths": array of strings
+- "weaknesses": array of strings
+- "missing_topics": array of strings
+- "improvement_suggestions": array of strings
 
-    score: int = Field(..., ge=0, le=10, description="Quality score 0-10")
-    strengths: list[str] = Field(default_factory=list)
-    weaknesses: list[str] = Field(default_factory=list)
-    missing_topics: list[str] = Field(default_factory=list)
-    improvement_suggestions: list[str] = Field(default_factory=list)
+Topic: {topic}
+Audience: {audience}
+Duration: {duration_minutes} minutes
+Language: {language}
+
+Title: {title}
+
+Manuscript content:
+{content_str}
+"""
+
+_REWRITE_SYSTEM_PROMPT = (
+    "You are an expert presentation writer. "
+    "Improve this SPOKEN MANUSCRIPT based on the feedback. "
+    "Write as if the presenter will read it aloud. "
+    "Output valid JSON matching the PresentationManuscript schema. "
+    "Keep continuous prose—no bullet points."
+)
+
+_REWRITE_PROMPT_TEMPLATE = """
+Improve the presentation manuscript below based on the evaluation feedback.
+
+Requirements:
+- Fix weaknesses
+- Incorporate missing content where relevant
+- Improve clarity and flow for spoken delivery
+- Keep same topic and duration
+- Maintain consistent style and language
+- Preserve section structure (Introduction, Main Part, Conclusion)
+- Output full prose in each section—no bullet points
+
+Output a JSON object with:
+- "title": string
+- "sections": array of objects with "name" (string) and "content" (string, full prose)
+
+Original manuscript:
+Title: {title}
+Sections: {content_preview}
+
+Evaluation feedback:
+{feedback}
+
+Context: topic={topic}, audience={audience}, duration={duration_minutes} min, language={language}
+"""
+
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Strict response_format for the evaluation; the JSON is unpacked by hand
+_EVALUATION_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ScriptReviewEvaluation",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "score": {"type": "integer"},
+                "strengths": _STRING_LIST,
+                "weaknesses": _STRING_LIST,
+                "missing_topics": _STRING_LIST,
+                "improvement_suggestions": _STRING_LIST,
+            },
+            "required": [
+                "score",
+                "strengths",
+                "weaknesses",
+                "missing_topics",
+                "improvement_suggestions",
+            ],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+
+
+@dataclass(slots=True)
+class ScriptReviewEvaluation:
+    """
+    Evaluation result from the LLM.
+
+    A plain dataclass rather than a pydantic model: it is read once to pick
+    approve vs. rewrite and to build the feedback text, so full validation
+    would only add overhead.
+    """
+
+    score: int = 0
+    strengths: list[str] = field(default_factory=list)
+    weaknesses: list[str] = field(default_factory=list)
+    missing_topics: list[str] = field(default_factory=list)
+    improvement_suggestions: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> ScriptReviewEvaluation:
+        """Build from decoded JSON; score is clamped to 0-10, missing lists default to []."""
+        return cls(
+            score=max(0, min(10, int(data["score"]))),
+            strengths=data.get("strengths") or [],
+            weaknesses=data.get("weaknesses") or [],
+            missing_topics=data.get("missing_topics") or [],
+            improvement_suggestions=data.get("improvement_suggestions") or [],
+        )
 
 
 class ScriptReviewer:
@@ -26,6 +169,9 @@ class ScriptReviewer:
     A) Evaluate manuscript on structure, clarity, audience fit, depth, engagement, duration
     B) If score >= 8: approve as-is. If score < 8: rewrite
     C) Return improved manuscript (or original on approval/failure)
+
+    Manuscripts that pass cheap local checks (structure, sentences, length)
+    skip A and B (score None) if skip_review_on_heuristic is enabled.
     """
 
     def __init__(
@@ -33,10 +179,42 @@ class ScriptReviewer:
         llm_client: LLMClient,
         evaluate_model: str | None = None,
         rewrite_model: str | None = None,
+        skip_review_on_heuristic: bool = False,
+        cache: Optional[CacheBackend] = None,
     ) -> None:
         self._llm = llm_client
         self._evaluate_model = evaluate_model
         self._rewrite_model = rewrite_model
+        self._skip_review_on_heuristic = skip_review_on_heuristic
+        # Evaluations of identical manuscripts are reused (None: always evaluate)
+        self._cache = cache
+
+    def _passes_heuristic(
+        self,
+        manuscript: PresentationManuscript,
+        audience: str,
+        duration_minutes: int,
+        speaker_profile: Optional[SpeakerProfile],
+    ) -> bool:
+        """True if local checks alone show the manuscript needs no review."""
+        if not self._skip_review_on_heuristic:
+            return False
+        sections = manuscript.sections
+        # Structural, not by section name: names follow the deck's language
+        if len(sections) < _HEURISTIC_MIN_SECTIONS:
+            return False
+        if not all(_SENTENCE_END_RE.search(s.content) for s in sections):
+            return False
+        # Same target the manuscript was written for (speaker profile included)
+        targets = compute_presentation_targets(
+            duration_minutes, audience, speaker_profile
+        )
+        return is_manuscript_length_acceptable(
+            manuscript,
+            targets["target_word_count"],
+            _HEURISTIC_TOLERANCE_LOW,
+            _HEURISTIC_TOLERANCE_HIGH,
+        )
 
     async def review_and_improve(
         self,
@@ -45,7 +223,9 @@ class ScriptReviewer:
         audience: str,
         duration_minutes: int,
         language: str,
-    ) -> tuple[PresentationManuscript, int]:
+        on_rewrite: Optional[Callable[[], None]] = None,
+        speaker_profile: Optional[SpeakerProfile] = None,
+    ) -> tuple[PresentationManuscript, Optional[int]]:
         """
         Evaluate the manuscript and improve it if score < 8.
 
@@ -55,24 +235,103 @@ class ScriptReviewer:
             audience: Target audience.
             duration_minutes: Duration in minutes.
             language: Presentation language.
+            on_rewrite: Called when the manuscript is sent for a rewrite.
+            speaker_profile: Profile the manuscript was written for; used by
+                the heuristic pre-filter to compute the same length target.
 
         Returns:
             Tuple of (final manuscript, evaluation score).
-            On failure, returns (original manuscript, 0).
+            On failure, returns (original manuscript, 0); if the heuristic
+            pre-filter accepted it without evaluation, the score is None.
         """
+        if self._passes_heuristic(
+            manuscript, audience, duration_minutes, speaker_profile
+        ):
+            return manuscript, None
         try:
             evaluation = await self._evaluate(
                 manuscript, topic, audience, duration_minutes, language
             )
+        except Exception:
+            return manuscript, 0
+        if evaluation.score >= 8:
+            return manuscript, evaluation.score
+        improved = await self._try_rewrite(
+            manuscript, evaluation, topic, audience, duration_minutes, language, on_rewrite
+        )
+        if improved is None:
+            return manuscript, 0
+        return improved, evaluation.score
+
+    async def review_with_speculation(
+        self,
+        manuscript: PresentationManuscript,
+        topic: str,
+        audience: str,
+        duration_minutes: int,
+        language: str,
+        downstream: Callable[[PresentationManuscript], Awaitable[T]],
+        on_rewrite: Optional[Callable[[], None]] = None,
+        speaker_profile: Optional[SpeakerProfile] = None,
+    ) -> tuple[PresentationManuscript, Optional[int], T]:
+        """
+        Review like review_and_improve while downstream already runs.
+
+        downstream(manuscript) starts on the original manuscript together with
+        the evaluation. On approval (score >= 8) or a failed review its result
+        is kept, so the review costs no time on the critical path. On a rewrite
+        it is cancelled and downstream runs again on the improved manuscript.
+        on_rewrite is called when the rewrite starts.
+
+        Returns:
+            Tuple of (final manuscript, evaluation score, downstream result);
+            the score is None if the heuristic pre-filter skipped the review.
+        """
+        if self._passes_heuristic(
+            manuscript, audience, duration_minutes, speaker_profile
+        ):
+            return manuscript, None, await downstream(manuscript)
+        speculative = asyncio.ensure_future(downstream(manuscript))
+        try:
+            try:
+                evaluation = await self._evaluate(
+                    manuscript, topic, audience, duration_minutes, language
+                )
+            except Exception:
+                return manuscript, 0, await speculative
             if evaluation.score >= 8:
-                return manuscript, evaluation.score
-            print("Improving script...")
-            improved = await self._rewrite(
+                return manuscript, evaluation.score, await speculative
+            speculative.cancel()
+            improved = await self._try_rewrite(
+                manuscript, evaluation, topic, audience, duration_minutes, language,
+                on_rewrite,
+            )
+            if improved is None:
+                return manuscript, 0, await downstream(manuscript)
+            return improved, evaluation.score, await downstream(improved)
+        finally:
+            # No-op once finished; stops the speculative work on any early exit
+            speculative.cancel()
+
+    async def _try_rewrite(
+        self,
+        manuscript: PresentationManuscript,
+        evaluation: ScriptReviewEvaluation,
+        topic: str,
+        audience: str,
+        duration_minutes: int,
+        language: str,
+        on_rewrite: Optional[Callable[[], None]],
+    ) -> Optional[PresentationManuscript]:
+        """Step C for both entry points: the improved manuscript, or None on failure."""
+        if on_rewrite is not None:
+            on_rewrite()
+        try:
+            return await self._rewrite(
                 manuscript, evaluation, topic, audience, duration_minutes, language
             )
-            return improved, evaluation.score
         except Exception:
-            return manuscript, 0
+            return None
 
     async def _evaluate(
         self,
@@ -83,53 +342,23 @@ class ScriptReviewer:
         language: str,
     ) -> ScriptReviewEvaluation:
         """Step A: Evaluate manuscript and return structured JSON."""
-        content_str = "\n\n---\n\n".join(
-            f"{s.name}:\n{s.content}" for s in manuscript.sections
-        )
-
-        system_prompt = (
-            "You are an expert presentation reviewer. "
-            "Evaluate this as a SPOKEN MANUSCRIPT—text to be read aloud. "
-            "Output valid JSON only."
+        prompt = _EVALUATE_PROMPT_TEMPLATE.format(
+            topic=topic,
+            audience=audience,
+            duration_minutes=duration_minutes,
+            language=language,
+            title=manuscript.title,
+            content_str=manuscript.sections_as_prompt_block(),
         )
 
-        prompt = f"""
-Evaluate this presentation manuscript (speech script to be read aloud):
-
-Topic: {topic}
-Audience: {audience}
-Duration: {duration_minutes} minutes
-Language: {language}
-
-Title: {manuscript.title}
-
-Manuscript content:
-{content_str}
-
-Evaluate on:
-- Structure and logical flow (does it read naturally?)
-- Clarity and understandability when spoken
-- Audience appropriateness
-- Depth of explanation
-- Engagement / rhetorical quality
-- Fit to time duration
-- Natural transitions between sections
-- Avoidance of robotic or outline-like phrasing
-
-Output a JSON object with:
-- "score": int (0-10, 10 = excellent spoken manuscript)
-- "strengths": array of strings
-- "weaknesses": array of strings
-- "missing_topics": array of strings
-- "improvement_suggestions": array of strings
-"""
-
-        return await self._llm.generate_structured(
+        data = await self._llm.generate_json(
             prompt=prompt,
-            response_model=ScriptReviewEvaluation,
-            system_prompt=system_prompt,
+            json_schema_format=_EVALUATION_FORMAT,
+            system_prompt=_EVALUATE_SYSTEM_PROMPT,
             model=self._evaluate_model,
+            cache=self._cache,
         )
+        return ScriptReviewEvaluation.from_json(data)
 
     async def _rewrite(
         self,
@@ -141,53 +370,35 @@ Output a JSON object with:
         language: str,
     ) -> PresentationManuscript:
         """Step C: Generate improved manuscript based on evaluation."""
-        system_prompt = (
-            "You are an expert presentation writer. "
-            "Improve this SPOKEN MANUSCRIPT based on the feedback. "
-            "Write as if the presenter will read it aloud. "
-            "Output valid JSON matching the PresentationManuscript schema. "
-            "Keep continuous prose—no bullet points."
-        )
-
         feedback = (
             f"Weaknesses: {', '.join(evaluation.weaknesses)}\n"
             f"Missing topics: {', '.join(evaluation.missing_topics)}\n"
             f"Suggestions: {', '.join(evaluation.improvement_suggestions)}"
         )
 
-        content_preview = "\n".join(
-            f"{s.name}: {s.content[:150]}..." for s in manuscript.sections
+        buf = io.StringIO()
+        for i, s in enumerate(manuscript.sections):
+            if i:
+                buf.write("\n")
+            buf.write(s.name)
+            buf.write(": ")
+            buf.write(s.content[:_PREVIEW_CHARS])
+            buf.write("...")
+        content_preview = buf.getvalue()
+
+        prompt = _REWRITE_PROMPT_TEMPLATE.format(
+            title=manuscript.title,
+            content_preview=content_preview,
+            feedback=feedback,
+            topic=topic,
+            audience=audience,
+            duration_minutes=duration_minutes,
+            language=language,
         )
 
-        prompt = f"""
-Improve this presentation manuscript based on the evaluation feedback.
-
-Original manuscript:
-Title: {manuscript.title}
-Sections: {content_preview}
-
-Evaluation feedback:
-{feedback}
-
-Context: topic={topic}, audience={audience}, duration={duration_minutes} min, language={language}
-
-Requirements:
-- Fix weaknesses
-- Incorporate missing content where relevant
-- Improve clarity and flow for spoken delivery
-- Keep same topic and duration
-- Maintain consistent style and language
-- Preserve section structure (Introduction, Main Part, Conclusion)
-- Output full prose in each section—no bullet points
-
-Output a JSON object with:
-- "title": string
-- "sections": array of objects with "name" (string) and "content" (string, full prose)
-"""
-
         return await self._llm.generate_structured(
             prompt=prompt,
             response_model=PresentationManuscript,
-            system_prompt=system_prompt,
+            system_prompt=_REWRITE_SYSTEM_PROMPT,
             model=self._rewrite_model,
         )
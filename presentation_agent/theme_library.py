@@ -11,7 +11,7 @@ from typing import Optional
 # Hex reference: #RRGGBB
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThemeStyle:
     """Complete theme definition for slide styling."""
 
@@ -105,6 +105,7 @@ THEMES: dict[str, ThemeStyle] = {
 }
 
 DEFAULT_THEME = Theme.LIGHT_PROFESSIONAL.value
+_DEFAULT_STYLE = THEMES[DEFAULT_THEME]
 
 
 def get_theme(theme_name: Optional[str] = None) -> ThemeStyle:
@@ -118,9 +119,12 @@ def get_theme(theme_name: Optional[str] = None) -> ThemeStyle:
         ThemeStyle for the theme.
     """
     if not theme_name:
-        return THEMES[DEFAULT_THEME]
-    key = str(theme_name).upper().strip()
-    return THEMES.get(key, THEMES[DEFAULT_THEME])
+        return _DEFAULT_STYLE
+    # Canonical names and Theme members hit directly; only others are normalized
+    style = THEMES.get(theme_name)
+    if style is not None:
+        return style
+    return THEMES.get(str(theme_name).upper().strip(), _DEFAULT_STYLE)
 
 
 def list_themes() -> list[str]: